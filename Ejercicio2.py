@@ -1,172 +1,178 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+# La verificación y la corrección viven en un módulo sin interfaz gráfica
+from parentesis import VerificacionEnVivo, corregir_parentesis, verificar_balanceo_detallado
 
-# Función para verificar paréntesis balanceados y detectar errores
-def verificar_balanceo_detallado(cadena):
-    """
-    Verifica si los paréntesis (), {}, [] están balanceados en la cadena.
-    Si hay un error, indica el tipo de paréntesis y la posición exacta (empezando en 1).
-    Devuelve: (balanceado: bool, mensaje: str, resumen: dict)
-    """
-    pila = []
-    pares = {')': '(', '}': '{', ']': '['}
-    resumen = {'(': 0, ')': 0, '{': 0, '}': 0, '[': 0, ']': 0}
-
-    for i, char in enumerate(cadena):
-        if char in '({[':
-            pila.append((char, i))
-            resumen[char] += 1
-        elif char in ')}]':
-            resumen[char] += 1
-            if not pila:
-                # No hay apertura correspondiente
-                return False, f"Error: paréntesis de cierre '{char}' sin apertura en posición {i+1}.", resumen
-            ultimo, pos_ultimo = pila[-1]
-            if ultimo != pares[char]:
-                # Paréntesis de cierre no coincide con el de apertura
-                return False, (
-                    f"Error: paréntesis de cierre '{char}' en posición {i+1} no coincide con "
-                    f"el de apertura '{ultimo}' en posición {pos_ultimo+1}."
-                ), resumen
-            pila.pop()
-
-    if pila:
-        # Hay paréntesis de apertura sin cerrar
-        char, pos = pila[-1]
-        return False, f"Error: paréntesis de apertura '{char}' sin cerrar en posición {pos+1}.", resumen
-
-    return True, "✅ Paréntesis balanceados correctamente.", resumen
-
-# Sugerencia de corrección automática de paréntesis
-def corregir_parentesis(cadena):
-    pila = []
-    resultado = []
-    pares = {')': '(', '}': '{', ']': '['}
-    apertura = {'(': ')', '{': '}', '[': ']'}
-    # Recorre la cadena y construye el resultado corrigiendo sobre la marcha
-    for char in cadena:
-        if char in '({[':
-            pila.append(char)
-            resultado.append(char)
-        elif char in ')}]':
-            if pila and pila[-1] == pares[char]:
-                pila.pop()
-                resultado.append(char)
-            else:
-                # Si hay un cierre sin apertura, lo ignoramos (lo quitamos)
-                continue
-        else:
-            resultado.append(char)
-    # Al final, agregamos los cierres faltantes
-    while pila:
-        resultado.append(apertura[pila.pop()])
-    return ''.join(resultado)
+ESPERA_MS = 150  # Pausa al escribir antes de volver a verificar
+MAX_RESALTADOS = 200  # Errores que se marcan en el texto como máximo
 
 # ---------------------- INTERFAZ GRÁFICA ----------------------
 
-ventana = tk.Tk()
-ventana.title("🧠 Analizador de Paréntesis Balanceados")
-ventana.geometry("650x450")
-ventana.config(bg="#f5f8fc")
-ventana.resizable(False, False)
-
-# Título principal
-ttk.Label(
-    ventana,
-    text="🔍 Verificador de Paréntesis ( ) [ ] { }",
-    font=("Arial", 16, "bold"),
-    background="#f5f8fc"
-).pack(pady=10)
-
-# Caja de entrada de texto
-entrada = tk.Text(
-    ventana,
-    font=("Arial", 12),
-    height=5,
-    width=70
-)
-entrada.pack(pady=10)
-
-# Botón para verificar
-ttk.Button(
-    ventana,
-    text="Verificar",
-    command=lambda: ejecutar_verificacion()
-).pack(pady=5)
-
-# Variables para mostrar resultados
-resultado_var = tk.StringVar()
-conteo_var = tk.StringVar()
-
-# Etiqueta de resultado principal
-resultado_label = ttk.Label(
-    ventana,
-    textvariable=resultado_var,
-    font=("Arial", 13, "italic"),
-    background="#f5f8fc"
-)
-resultado_label.pack(pady=10)
-
-# Etiqueta de conteo de paréntesis
-ttk.Label(
-    ventana,
-    text="📊 Conteo de Paréntesis:",
-    background="#f5f8fc",
-    font=("Arial", 12, "bold")
-).pack()
-conteo_label = ttk.Label(
-    ventana,
-    textvariable=conteo_var,
-    font=("Consolas", 11),
-    background="#f5f8fc"
-)
-conteo_label.pack(pady=5)
-
-# Función para mostrar resultado
-def ejecutar_verificacion():
-    texto = entrada.get("1.0", tk.END).strip()
-    if not texto:
-        messagebox.showwarning("Entrada vacía", "Por favor ingrese una expresión.")
-        return
-
-    balanceado, mensaje, resumen = verificar_balanceo_detallado(texto)
-    resultado_var.set(mensaje)
-    resultado_label.config(foreground="green" if balanceado else "red")
-
-    # Mostrar conteo de paréntesis
-    resumen_text = (
-        f"( : {resumen['(']}    ) : {resumen[')']}\n"
-        f"{{ : {resumen['{']}}}    }} : {resumen['}']}\n"
-        f"[ : {resumen['[']}    ] : {resumen[']']}"
-    )
-    conteo_var.set(resumen_text)
-
-# Función para copiar resultado
-def copiar_resultado():
-    ventana.clipboard_clear()
-    ventana.clipboard_append(resultado_var.get())
-    ventana.update()
-    messagebox.showinfo("Copiado", "Resultado copiado al portapapeles.")
-
-# Función para mostrar la corrección
-def mostrar_correccion():
-    texto = entrada.get("1.0", tk.END).strip()
-    if not texto:
-        messagebox.showwarning("Entrada vacía", "Por favor ingrese una expresión.")
-        return
-    corregido = corregir_parentesis(texto)
-    messagebox.showinfo("Cadena Corregida", f"Expresión balanceada:\n{corregido}")
-
-# Botón copiar resultado
-ttk.Button(ventana, text="Copiar resultado", command=copiar_resultado).pack(pady=10)
-
-# Botón para corregir paréntesis
-ttk.Button(ventana, text="Corregir paréntesis", command=mostrar_correccion).pack(pady=5)
-
-ventana.mainloop()
+class Interfaz:
+    def __init__(self, ventana):
+        self.ventana = ventana
+        ventana.title("🧠 Analizador de Paréntesis Balanceados")
+        ventana.geometry("650x450")
+        ventana.config(bg="#f5f8fc")
+        ventana.resizable(False, False)
+
+        # Título principal
+        ttk.Label(
+            ventana,
+            text="🔍 Verificador de Paréntesis ( ) [ ] { }",
+            font=("Arial", 16, "bold"),
+            background="#f5f8fc"
+        ).pack(pady=10)
+
+        # Caja de entrada de texto
+        self.entrada = tk.Text(
+            ventana,
+            font=("Arial", 12),
+            height=5,
+            width=70
+        )
+        self.entrada.pack(pady=10)
+        self.entrada.tag_configure("error", background="#ffc9c9", foreground="#b00020")
+
+        # Verificación mientras se escribe: solo se vuelve a recorrer desde el último punto de
+        # control anterior a la primera posición editada
+        self.vivo = VerificacionEnVivo()
+        self.cambio = None  # Primera posición (en caracteres) editada desde la última verificación
+        self.pendiente = None  # after() programado para verificar
+        self._interceptar_ediciones()
+        self.entrada.bind("<<Modified>>", self.al_modificar)
+
+        # Botón para verificar
+        ttk.Button(
+            ventana,
+            text="Verificar",
+            command=self.ejecutar_verificacion
+        ).pack(pady=5)
+
+        # Variables para mostrar resultados
+        self.resultado_var = tk.StringVar()
+        self.conteo_var = tk.StringVar()
+
+        # Etiqueta de resultado principal
+        self.resultado_label = ttk.Label(
+            ventana,
+            textvariable=self.resultado_var,
+            font=("Arial", 13, "italic"),
+            background="#f5f8fc"
+        )
+        self.resultado_label.pack(pady=10)
+
+        # Etiqueta de conteo de paréntesis
+        ttk.Label(
+            ventana,
+            text="📊 Conteo de Paréntesis:",
+            background="#f5f8fc",
+            font=("Arial", 12, "bold")
+        ).pack()
+        self.conteo_label = ttk.Label(
+            ventana,
+            textvariable=self.conteo_var,
+            font=("Consolas", 11),
+            background="#f5f8fc"
+        )
+        self.conteo_label.pack(pady=5)
+
+        # Botón copiar resultado
+        ttk.Button(ventana, text="Copiar resultado", command=self.copiar_resultado).pack(pady=10)
+
+        # Botón para corregir paréntesis
+        ttk.Button(ventana, text="Corregir paréntesis", command=self.mostrar_correccion).pack(pady=5)
+
+    def _interceptar_ediciones(self):
+        # El comando Tcl del widget se reemplaza por uno que anota dónde cae cada insert/delete
+        # antes de pasarlo al original (<<Modified>> avisa que hubo cambios, pero no dónde)
+        widget = self.entrada._w
+        self._original = widget + "_original"
+        self.entrada.tk.call("rename", widget, self._original)
+        self.entrada.tk.createcommand(widget, self._proxy)
+
+    def _proxy(self, *args):
+        if args and args[0] in ("insert", "delete", "replace"):
+            try:
+                posicion = int(self.entrada.tk.call(self._original, "count", "-chars", "1.0", args[1]) or 0)
+            except tk.TclError:
+                # Índice inválido (por ejemplo "sel.first" sin selección): el comando original
+                # fallará igual y no cambia nada, así que no hay posición que anotar
+                posicion = None
+            if posicion is not None:
+                self.cambio = posicion if self.cambio is None else min(self.cambio, posicion)
+        elif args[:2] in (("edit", "undo"), ("edit", "redo")):
+            self.cambio = 0  # Deshacer no dice dónde cambia el texto: se verifica todo
+        # Los errores del comando original llegan a quien lo llamó, como sin el proxy
+        return self.entrada.tk.call((self._original,) + args)
+
+    def al_modificar(self, evento=None):
+        self.entrada.edit_modified(False)  # Para que el próximo cambio vuelva a generar el evento
+        if self.pendiente:
+            self.ventana.after_cancel(self.pendiente)
+        self.pendiente = self.ventana.after(ESPERA_MS, self.revalidar)
+
+    def revalidar(self):
+        self.pendiente = None
+        # Sin ediciones anotadas se reutiliza el último punto de control
+        cambio = float("inf") if self.cambio is None else self.cambio
+        self.cambio = None
+        verificador = self.vivo.revalidar(lambda inicio: self.entrada.get(f"1.0 + {inicio} chars", "end-1c"), cambio)
+        self.mostrar_resultado(verificador)
+
+    def mostrar_resultado(self, verificador):
+        self.entrada.tag_remove("error", "1.0", tk.END)
+        for posicion, _ in verificador.errores[:MAX_RESALTADOS]:
+            inicio = f"1.0 + {posicion} chars"
+            self.entrada.tag_add("error", inicio, inicio + " + 1 chars")
+
+        balanceado, mensaje, resumen = verificador.resultado()
+        if len(verificador.errores) > 1:
+            mensaje += f" ({len(verificador.errores)} errores en total)"
+        self.resultado_var.set(mensaje)
+        self.resultado_label.config(foreground="green" if balanceado else "red")
+
+        # Mostrar conteo de paréntesis
+        resumen_text = (
+            f"( : {resumen['(']}    ) : {resumen[')']}\n"
+            f"{{ : {resumen['{']}}}    }} : {resumen['}']}\n"
+            f"[ : {resumen['[']}    ] : {resumen[']']}"
+        )
+        self.conteo_var.set(resumen_text)
+
+    # Función para mostrar resultado
+    def ejecutar_verificacion(self):
+        if not self.entrada.get("1.0", tk.END).strip():
+            messagebox.showwarning("Entrada vacía", "Por favor ingrese una expresión.")
+            return
+        # No espera a la pausa de escritura: verifica ya lo que haya cambiado
+        if self.pendiente:
+            self.ventana.after_cancel(self.pendiente)
+        self.revalidar()
+
+    # Función para copiar resultado
+    def copiar_resultado(self):
+        self.ventana.clipboard_clear()
+        self.ventana.clipboard_append(self.resultado_var.get())
+        self.ventana.update()
+        messagebox.showinfo("Copiado", "Resultado copiado al portapapeles.")
+
+    # Función para mostrar la corrección
+    def mostrar_correccion(self):
+        texto = self.entrada.get("1.0", tk.END).strip()
+        if not texto:
+            messagebox.showwarning("Entrada vacía", "Por favor ingrese una expresión.")
+            return
+        corregido = corregir_parentesis(texto)
+        messagebox.showinfo("Cadena Corregida", f"Expresión balanceada:\n{corregido}")
+
+if __name__ == "__main__":
+    ventana = tk.Tk()  # La ventana solo se crea al ejecutar el archivo, no al importarlo
+    app = Interfaz(ventana)
+    ventana.mainloop()
 
 
 '''
 Ejemplo de uso
 Mi amiga Laura (quien siempre ha sido muy puntual, aunque últimamente [especialmente desde que empezó su nuevo trabajo], ha estado llegando tarde a nuestras reuniones).
-'''
\ No newline at end of file
+'''
@@ -1,95 +1,907 @@
 import tkinter as tk
 from tkinter import messagebox, simpledialog, filedialog
 import random
+import bisect
+import sys
+import mmap
+import itertools
+import struct
+import os
+import queue
+import threading
+from array import array
 
 class Cancion:
+    __slots__ = ("nombre", "siguiente", "anterior", "nodo_rango")  # Sin __dict__ por nodo: listas grandes ocupan mucho menos
+
     def __init__(self, nombre):
         self.nombre = nombre
         self.siguiente = None
         self.anterior = None
+        self.nodo_rango = None  # Nodo en IndiceRango, solo si se usa el acceso por posición
+
+def _agregar_a_indice(indice, clave, nodo):
+    # Devuelve True si la clave es nueva en el índice
+    actual = indice.get(clave)
+    if actual is None:
+        indice[clave] = nodo
+        return True
+    if isinstance(actual, dict):
+        actual[nodo] = None
+    else:
+        indice[clave] = {actual: None, nodo: None}
+    return False
+
+def _quitar_de_indice(indice, clave, nodo):
+    # Devuelve True si la clave desapareció del índice
+    actual = indice[clave]
+    if not isinstance(actual, dict):
+        del indice[clave]
+        return True
+    del actual[nodo]
+    if len(actual) == 1:
+        indice[clave] = next(iter(actual))
+    return False
+
+def _nodos_de(valor):
+    # Nodos guardados en una entrada del índice, en orden de inserción
+    return valor if isinstance(valor, dict) else (valor,)
+
+class ArchivoListaBinaria:
+    """
+    Lista en formato binario: los nombres en UTF-8 uno tras otro, luego un índice de
+    desplazamientos (uint64) y al final un pie con la cantidad y dónde empieza el índice.
+    Se abre con mmap, así que abrir es inmediato y cada nombre se decodifica al pedirlo.
+    """
+    MAGIA = b"LRB1"
+    PIE = struct.Struct("<QQ4s")  # Cantidad, inicio del índice, magia
+
+    def __init__(self, archivo):
+        self._archivo = open(archivo, 'rb')
+        self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        pie = self._mapa[-self.PIE.size:]
+        self.cantidad, inicio_indice, magia = self.PIE.unpack(pie)
+        if magia != self.MAGIA or self._mapa[:4] != self.MAGIA:
+            self.cerrar()
+            raise ValueError(f"{archivo} no es una lista binaria")
+        self._desplazamientos = memoryview(self._mapa)[inicio_indice:inicio_indice + 8 * (self.cantidad + 1)].cast('Q')
+
+    def __len__(self):
+        return self.cantidad
+
+    def nombres(self, inicio, fin):
+        desplazamientos, mapa = self._desplazamientos, self._mapa
+        return [mapa[desplazamientos[i]:desplazamientos[i + 1]].decode('utf-8') for i in range(inicio, fin)]
+
+    def cerrar(self):
+        if hasattr(self, '_desplazamientos'):
+            self._desplazamientos.release()
+        self._mapa.close()
+        self._archivo.close()
+
+    @classmethod
+    def guardar(cls, nombres, archivo, bloque=4096):
+        """Escribe los nombres de un iterable de a `bloque`, sin tenerlos todos en memoria"""
+        desplazamientos = array('Q', [len(cls.MAGIA)])
+        with open(archivo, 'wb', buffering=1 << 20) as f:
+            f.write(cls.MAGIA)
+            nombres = iter(nombres)
+            while True:
+                parte = list(itertools.islice(nombres, bloque))
+                if not parte:
+                    break
+                datos = ''.join(parte).encode('utf-8')
+                if len(datos) == sum(map(len, parte)):
+                    largos = map(len, parte)  # Todo ASCII: un byte por carácter
+                else:
+                    largos = (len(nombre.encode('utf-8')) for nombre in parte)
+                # accumulate vuelve a emitir el valor inicial, por eso se saca antes
+                desplazamientos.extend(itertools.accumulate(largos, initial=desplazamientos.pop()))
+                f.write(datos)
+            inicio_indice = f.tell()
+            f.write(desplazamientos.tobytes())
+            f.write(cls.PIE.pack(len(desplazamientos) - 1, inicio_indice, cls.MAGIA))
+
+class _NodoRango:
+    __slots__ = ("cancion", "izq", "der", "padre", "prioridad", "tamano")
+
+    def __init__(self, cancion, prioridad):
+        self.cancion = cancion
+        self.izq = self.der = self.padre = None
+        self.prioridad = prioridad
+        self.tamano = 1
+
+def _tamano(nodo):
+    return nodo.tamano if nodo else 0
+
+class IndiceRango:
+    """
+    Treap implícito (ordenado por posición) sobre las canciones de la lista.
+    Cada nodo guarda el tamaño de su subárbol: posición de una canción, canción en
+    una posición, inserción y borrado en O(log n) esperado.
+    """
+    def __init__(self, canciones=()):
+        self.azar = random.Random()
+        self.raiz = None
+        self.construir(canciones)
+
+    def __len__(self):
+        return _tamano(self.raiz)
+
+    def construir(self, canciones):
+        # Árbol cartesiano en O(n) con una pila: las canciones ya vienen en orden
+        pila = []
+        for cancion in canciones:
+            nodo = _NodoRango(cancion, self.azar.random())
+            cancion.nodo_rango = nodo
+            ultimo = None
+            while pila and pila[-1].prioridad < nodo.prioridad:
+                ultimo = pila.pop()
+            if ultimo:
+                nodo.izq = ultimo
+                ultimo.padre = nodo
+            if pila:
+                pila[-1].der = nodo
+                nodo.padre = pila[-1]
+            pila.append(nodo)
+        self.raiz = pila[0] if pila else None
+        # Tamaños: en preorden invertido cada hijo se procesa antes que su padre
+        preorden = []
+        pendientes = [self.raiz] if self.raiz else []
+        while pendientes:
+            nodo = pendientes.pop()
+            preorden.append(nodo)
+            pendientes.extend(hijo for hijo in (nodo.izq, nodo.der) if hijo)
+        for nodo in reversed(preorden):
+            nodo.tamano = 1 + _tamano(nodo.izq) + _tamano(nodo.der)
+
+    def rango(self, cancion):
+        nodo = cancion.nodo_rango
+        posicion = _tamano(nodo.izq)
+        while nodo.padre:
+            if nodo is nodo.padre.der:
+                posicion += _tamano(nodo.padre.izq) + 1
+            nodo = nodo.padre
+        return posicion
+
+    def en(self, posicion):
+        if not 0 <= posicion < len(self):
+            raise IndexError("posición fuera de la lista")
+        nodo = self.raiz
+        while True:
+            izquierda = _tamano(nodo.izq)
+            if posicion < izquierda:
+                nodo = nodo.izq
+            elif posicion == izquierda:
+                return nodo.cancion
+            else:
+                posicion -= izquierda + 1
+                nodo = nodo.der
+
+    def _rotar_arriba(self, x):
+        p = x.padre
+        abuelo = p.padre
+        if x is p.izq:
+            p.izq = x.der
+            if x.der:
+                x.der.padre = p
+            x.der = p
+        else:
+            p.der = x.izq
+            if x.izq:
+                x.izq.padre = p
+            x.izq = p
+        p.padre = x
+        x.padre = abuelo
+        if abuelo is None:
+            self.raiz = x
+        elif abuelo.izq is p:
+            abuelo.izq = x
+        else:
+            abuelo.der = x
+        p.tamano = 1 + _tamano(p.izq) + _tamano(p.der)
+        x.tamano = 1 + _tamano(x.izq) + _tamano(x.der)
+
+    def insertar(self, posicion, cancion):
+        nuevo = _NodoRango(cancion, self.azar.random())
+        cancion.nodo_rango = nuevo
+        if self.raiz is None:
+            self.raiz = nuevo
+            return
+        nodo = self.raiz
+        while True:
+            nodo.tamano += 1
+            izquierda = _tamano(nodo.izq)
+            if posicion <= izquierda:
+                if nodo.izq is None:
+                    nodo.izq = nuevo
+                    break
+                nodo = nodo.izq
+            else:
+                posicion -= izquierda + 1
+                if nodo.der is None:
+                    nodo.der = nuevo
+                    break
+                nodo = nodo.der
+        nuevo.padre = nodo
+        while nuevo.padre and nuevo.prioridad > nuevo.padre.prioridad:
+            self._rotar_arriba(nuevo)
+
+    def eliminar(self, cancion):
+        nodo = cancion.nodo_rango
+        cancion.nodo_rango = None
+        # Se baja el nodo rotando con el hijo de mayor prioridad hasta que sea hoja
+        while nodo.izq or nodo.der:
+            if nodo.der is None or (nodo.izq and nodo.izq.prioridad > nodo.der.prioridad):
+                self._rotar_arriba(nodo.izq)
+            else:
+                self._rotar_arriba(nodo.der)
+        padre = nodo.padre
+        if padre is None:
+            self.raiz = None
+            return
+        if padre.izq is nodo:
+            padre.izq = None
+        else:
+            padre.der = None
+        while padre:
+            padre.tamano -= 1
+            padre = padre.padre
+
+class MotorAleatorio:
+    """
+    Orden aleatorio sin repeticiones: una permutación de Fisher-Yates por ronda.
+    Las posiciones hasta `cursor` ya sonaron; siguiente/anterior se mueven por la
+    permutación en O(1) y las altas y bajas la ajustan sin volver a barajar.
+    """
+    def __init__(self, azar):
+        self.azar = azar
+        self.orden = []
+        self.posiciones = {}
+        self.cursor = -1
+        self.huecos = 0
+
+    def nueva_ronda(self, nodos, actual):
+        self.orden = list(nodos)
+        self.azar.shuffle(self.orden)
+        self.posiciones = {nodo: i for i, nodo in enumerate(self.orden)}
+        self.huecos = 0
+        self.cursor = -1
+        if actual in self.posiciones:
+            # La canción que suena abre la ronda para no repetirla enseguida
+            self._intercambiar(0, self.posiciones[actual])
+            self.cursor = 0
+
+    def _intercambiar(self, i, j):
+        self.orden[i], self.orden[j] = self.orden[j], self.orden[i]
+        for k in (i, j):
+            if self.orden[k] is not None:
+                self.posiciones[self.orden[k]] = k
+
+    def siguiente(self):
+        i = self.cursor + 1
+        while i < len(self.orden) and self.orden[i] is None:
+            i += 1
+        if i >= len(self.orden):
+            return None
+        self.cursor = i
+        return self.orden[i]
+
+    def anterior(self):
+        i = self.cursor - 1
+        while i >= 0 and self.orden[i] is None:
+            i -= 1
+        if i < 0:
+            return None
+        self.cursor = i
+        return self.orden[i]
+
+    def agregar(self, nodo):
+        # Inserción "de adentro hacia afuera": posición uniforme entre las que faltan sonar
+        self.orden.append(nodo)
+        self.posiciones[nodo] = len(self.orden) - 1
+        self._intercambiar(len(self.orden) - 1, self.azar.randint(self.cursor + 1, len(self.orden) - 1))
+
+    def eliminar(self, nodo):
+        i = self.posiciones.pop(nodo, None)
+        if i is None:
+            return
+        if i > self.cursor:
+            # Aún no sonó: se reemplaza por la última, el resto sigue siendo aleatorio
+            ultimo = self.orden.pop()
+            if i < len(self.orden):
+                self.orden[i] = ultimo
+                if ultimo is not None:
+                    self.posiciones[ultimo] = i
+        else:
+            # Ya sonó: se deja un hueco para no alterar el orden de "anterior"
+            self.orden[i] = None
+            self.huecos += 1
+            if self.huecos * 2 > len(self.orden):
+                self._compactar()
+
+    def _compactar(self):
+        self.cursor -= sum(1 for nodo in self.orden[:self.cursor + 1] if nodo is None)
+        self.orden = [nodo for nodo in self.orden if nodo is not None]
+        self.posiciones = {nodo: i for i, nodo in enumerate(self.orden)}
+        self.huecos = 0
+
+class EscritorCambios:
+    """
+    Escribe en segundo plano el registro de cambios de una lista (archivo + ".cambios").
+    La primera línea identifica la versión del archivo completo (tamaño y mtime) a la que
+    se aplican los cambios; si no coincide, el registro es de una versión anterior y se ignora.
+    """
+    def __init__(self, ruta, cabecera=None):
+        self.ruta = ruta
+        self.error = None
+        self._cola = queue.Queue()
+        if cabecera is None:
+            self._archivo = open(ruta, "a", encoding="utf-8")  # Continúa un registro válido
+        else:
+            self._archivo = None
+            self._cola.put(("reiniciar", cabecera))
+        self._hilo = threading.Thread(target=self._escribir, daemon=True)
+        self._hilo.start()
+
+    def anotar(self, linea):
+        self._cola.put(linea)
+
+    def reiniciar(self, cabecera):
+        # Marca de compactación: lo anterior ya está en el archivo completo
+        self._cola.put(("reiniciar", cabecera))
+
+    def esperar(self):
+        """Bloquea hasta que todo lo anotado esté escrito y sincronizado en disco"""
+        self._cola.join()
+        if self.error:
+            raise self.error
+
+    def cerrar(self):
+        self._cola.put(None)
+        self._hilo.join()
+        if self.error:
+            raise self.error
+
+    def _escribir(self):
+        terminar = False
+        while not terminar:
+            mensajes = [self._cola.get()]
+            try:  # Todo lo que se haya acumulado se escribe con un solo fsync
+                while True:
+                    mensajes.append(self._cola.get_nowait())
+            except queue.Empty:
+                pass
+            try:
+                for mensaje in mensajes:
+                    if mensaje is None:
+                        terminar = True
+                    elif isinstance(mensaje, tuple):
+                        if self._archivo:
+                            self._archivo.close()
+                        self._archivo = open(self.ruta, "w", encoding="utf-8")
+                        self._archivo.write(mensaje[1])
+                    elif self.error is None:
+                        self._archivo.write(mensaje)
+                if self._archivo:
+                    self._archivo.flush()
+                    os.fsync(self._archivo.fileno())
+                    if terminar:
+                        self._archivo.close()
+            except OSError as error:
+                self.error = error  # Se informa en el hilo principal al esperar o cerrar
+            finally:
+                for _ in mensajes:
+                    self._cola.task_done()
+
+def _cabecera_de(archivo):
+    estado = os.stat(archivo)
+    return f"# lista {estado.st_size} {estado.st_mtime_ns}\n"
 
 class ListaReproduccion:
-    def __init__(self):
+    def __init__(self, semilla=None):
         self.primera = None
+        self.ultima = None  # Referencia a la cola de la lista: agregar al final es O(1)
         self.actual = None
+        self.azar = random.Random(semilla)  # Con semilla el modo aleatorio es reproducible
+        self._cantidad = 0
+        self._rango = None  # IndiceRango, se construye la primera vez que se accede por posición
+        # Aumenta al quitar una canción o insertar una en el medio, que cambia la posición de las
+        # siguientes; agregar al final no lo toca (ver VisorLista.refrescar)
+        self._version_filas = 0
+        # Lista binaria abierta de la que aún quedan canciones por crear (ver cargar_binario)
+        self._fuente = None
+        self._pendiente = 0
+        self._aleatorio = None
         self.modo_aleatorio = False
+        # Índice nombre -> nodo; si el nombre se repite, dict de nodos en orden de inserción
+        self._indice = {}
+        # Índices opcionales que se construyen la primera vez que se piden
+        self._indice_minusculas = None
+        self._claves_ordenadas = None
+        # Autoguardado: cambios desde el último guardado completo y archivo del que viene la lista
+        self.cambios_sin_guardar = 0
+        self._origen = None
+        self._escritor = None
+        self._archivo_autoguardado = None
+        self._cambios_registrados = 0
+        self.compactar_cada = 1000
+
+    @property
+    def modo_aleatorio(self):
+        return self._modo_aleatorio
+
+    @modo_aleatorio.setter
+    def modo_aleatorio(self, valor):
+        self._modo_aleatorio = valor
+        self._aleatorio = None  # Al reactivarlo se baraja una ronda nueva
+
+    BLOQUE_PEREZOSO = 1024  # Canciones que se crean de una vez al avanzar por una lista binaria
+
+    def _nodos(self, desde=None):
+        temp = self.primera if desde is None else desde
+        while temp:
+            yield temp
+            if temp.siguiente is None and self._fuente is not None:
+                self._materializar(self.BLOQUE_PEREZOSO)
+            temp = temp.siguiente
+
+    def _materializar(self, cantidad):
+        # Crea los nodos de las próximas `cantidad` canciones de la lista binaria abierta
+        fin = min(self._pendiente + cantidad, len(self._fuente))
+        for nombre in self._fuente.nombres(self._pendiente, fin):
+            self._agregar_al_final(nombre)
+        self._pendiente = fin
+        if fin == len(self._fuente):
+            self._fuente.cerrar()
+            self._fuente = None
+
+    def _completar(self):
+        # Operaciones que necesitan la lista entera (índices, agregar al final) la terminan de crear
+        if self._fuente is not None:
+            self._materializar(len(self._fuente))
+
+    def _indexar(self, nodo):
+        _agregar_a_indice(self._indice, nodo.nombre, nodo)
+        if self._indice_minusculas is not None:
+            if _agregar_a_indice(self._indice_minusculas, nodo.nombre.casefold(), nodo):
+                self._claves_ordenadas = None
+
+    def _desindexar(self, nodo):
+        _quitar_de_indice(self._indice, nodo.nombre, nodo)
+        if self._indice_minusculas is not None:
+            if _quitar_de_indice(self._indice_minusculas, nodo.nombre.casefold(), nodo):
+                self._claves_ordenadas = None
+
+    def _desenlazar(self, nodo):
+        if nodo.anterior:
+            nodo.anterior.siguiente = nodo.siguiente
+        else:
+            self.primera = nodo.siguiente
+        if nodo.siguiente:
+            nodo.siguiente.anterior = nodo.anterior
+        else:
+            self.ultima = nodo.anterior
+        if self.actual == nodo:
+            self.actual = nodo.siguiente or nodo.anterior
+        self._desindexar(nodo)
+        self._cantidad -= 1
+        if self._aleatorio is not None:
+            self._aleatorio.eliminar(nodo)
+        if self._rango is not None:
+            self._rango.eliminar(nodo)
+        self._version_filas += 1
 
     def agregar_cancion(self, nombre):
-        nueva = Cancion(nombre)
+        self._completar()
+        self._agregar_al_final(nombre)
+        self._anotar("+", nombre)
+
+    def _agregar_al_final(self, nombre):
+        nueva = Cancion(sys.intern(nombre))  # Los nombres repetidos comparten una sola cadena
         if not self.primera:
-            self.primera = self.actual = nueva
+            self.primera = self.ultima = self.actual = nueva
         else:
-            temp = self.primera
-            while temp.siguiente:
-                temp = temp.siguiente
-            temp.siguiente = nueva
-            nueva.anterior = temp
+            self.ultima.siguiente = nueva
+            nueva.anterior = self.ultima
+            self.ultima = nueva
+        self._registrar_alta(nueva)
+        if self._rango is not None:
+            self._rango.insertar(len(self._rango), nueva)
+
+    def _registrar_alta(self, nueva):
+        self._indexar(nueva)
+        self._cantidad += 1
+        if self._aleatorio is not None:
+            self._aleatorio.agregar(nueva)
 
     def eliminar_cancion(self, nombre):
-        temp = self.primera
-        while temp:
-            if temp.nombre == nombre:
-                if temp.anterior:
-                    temp.anterior.siguiente = temp.siguiente
-                else:
-                    self.primera = temp.siguiente
-                if temp.siguiente:
-                    temp.siguiente.anterior = temp.anterior
-                if self.actual == temp:
-                    self.actual = temp.siguiente or temp.anterior
-                return True
-            temp = temp.siguiente
-        return False
+        self._completar()
+        nodos = self._indice.get(nombre)
+        if nodos is None:
+            return False
+        if isinstance(nodos, dict) and self._rango is not None:
+            # Con inserciones por posición el orden de alta ya no es el de la lista
+            self._desenlazar(min(nodos, key=self._rango.rango))
+        else:
+            self._desenlazar(next(iter(_nodos_de(nodos))))  # Primera aparición del nombre
+        self._anotar("-", nombre)
+        return True
+
+    # ---------- Acceso por posición ----------
+
+    def __len__(self):
+        return self._cantidad + (len(self._fuente) - self._pendiente if self._fuente is not None else 0)
+
+    def _indice_rango(self):
+        # Se completa siempre: una lista binaria abierta después de crear el índice solo tiene
+        # indexadas las canciones creadas hasta ahora (las que se creen se insertan al final)
+        self._completar()
+        if self._rango is None:
+            self._rango = IndiceRango(self._nodos())
+        return self._rango
+
+    def __iter__(self):
+        """Recorre los nombres sin armar una lista (las listas binarias se crean por bloques)"""
+        return (cancion.nombre for cancion in self._nodos())
+
+    def canciones(self, inicio=0):
+        """Nombres desde la posición `inicio` en adelante, como generador"""
+        if inicio == 0:
+            return iter(self)
+        return (cancion.nombre for cancion in self._nodos(self._indice_rango().en(inicio)))
+
+    def ir_a(self, indice):
+        """Convierte en actual la canción de la posición `indice` (desde 0)"""
+        self.actual = self._indice_rango().en(indice)
+
+    def posicion_actual(self):
+        """Posición (desde 0) de la canción actual, o None si la lista está vacía"""
+        if not self.actual:
+            return None
+        return self._indice_rango().rango(self.actual)
+
+    def insertar_cancion(self, indice, nombre):
+        """Inserta una canción para que quede en la posición `indice`"""
+        rango = self._indice_rango()
+        if not 0 <= indice <= len(rango):
+            raise IndexError("posición fuera de la lista")
+        if indice == len(rango):
+            self._agregar_al_final(nombre)
+        else:
+            siguiente = rango.en(indice)
+            nueva = Cancion(sys.intern(nombre))
+            nueva.siguiente = siguiente
+            nueva.anterior = siguiente.anterior
+            if siguiente.anterior:
+                siguiente.anterior.siguiente = nueva
+            else:
+                self.primera = nueva
+            siguiente.anterior = nueva
+            self._registrar_alta(nueva)
+            rango.insertar(indice, nueva)
+            self._version_filas += 1
+        self._anotar("i", str(indice), nombre)
+
+    def eliminar_en(self, indice):
+        """Elimina la canción de la posición `indice` y devuelve su nombre"""
+        nodo = self._indice_rango().en(indice)
+        self._desenlazar(nodo)
+        self._anotar("x", str(indice))
+        return nodo.nombre
 
     def siguiente_cancion(self):
         if self.modo_aleatorio:
-            canciones = self.obtener_lista()
-            if canciones:
-                self.actual = random.choice([c for c in canciones if c != self.actual])
-        elif self.actual and self.actual.siguiente:
-            self.actual = self.actual.siguiente
+            if not self.actual:
+                return
+            self._completar()
+            if self._aleatorio is None:
+                self._aleatorio = MotorAleatorio(self.azar)
+                self._aleatorio.nueva_ronda(self._nodos(), self.actual)
+            nodo = self._aleatorio.siguiente()
+            if nodo is None:
+                # Terminó la ronda: se baraja otra que empieza por la canción actual
+                self._aleatorio.nueva_ronda(self._nodos(), self.actual)
+                nodo = self._aleatorio.siguiente()
+            if nodo is not None:
+                self.actual = nodo
+        elif self.actual:
+            if self.actual.siguiente is None and self._fuente is not None:
+                self._materializar(self.BLOQUE_PEREZOSO)
+            if self.actual.siguiente:
+                self.actual = self.actual.siguiente
 
     def anterior_cancion(self):
-        if self.actual and self.actual.anterior:
+        if self.modo_aleatorio and self._aleatorio is not None:
+            nodo = self._aleatorio.anterior()
+            if nodo is not None:
+                self.actual = nodo
+        elif self.actual and self.actual.anterior:
             self.actual = self.actual.anterior
 
     def repetir(self):
         return self.actual.nombre if self.actual else "No hay canción."
 
-    def buscar(self, nombre):
-        temp = self.primera
-        while temp:
-            if temp.nombre == nombre:
-                return True
-            temp = temp.siguiente
-        return False
+    def _minusculas(self):
+        self._completar()
+        if self._indice_minusculas is None:
+            self._indice_minusculas = {}
+            for nodos in self._indice.values():
+                for nodo in _nodos_de(nodos):
+                    _agregar_a_indice(self._indice_minusculas, nodo.nombre.casefold(), nodo)
+        return self._indice_minusculas
+
+    def buscar(self, nombre, ignorar_mayusculas=False):
+        self._completar()
+        if ignorar_mayusculas:
+            return nombre.casefold() in self._minusculas()
+        return nombre in self._indice
+
+    def buscar_prefijo(self, prefijo, limite=None):
+        """Nombres distintos que empiezan por el prefijo, sin distinguir mayúsculas, en orden alfabético"""
+        indice = self._minusculas()
+        if self._claves_ordenadas is None:
+            self._claves_ordenadas = sorted(indice)
+        prefijo = prefijo.casefold()
+        encontrados = []
+        i = bisect.bisect_left(self._claves_ordenadas, prefijo)
+        while i < len(self._claves_ordenadas) and self._claves_ordenadas[i].startswith(prefijo):
+            for nombre in dict.fromkeys(nodo.nombre for nodo in _nodos_de(indice[self._claves_ordenadas[i]])):
+                encontrados.append(nombre)
+                if limite is not None and len(encontrados) >= limite:
+                    return encontrados
+            i += 1
+        return encontrados
 
     def obtener_lista(self):
-        lista = []
-        temp = self.primera
-        while temp:
-            lista.append(temp)
-            temp = temp.siguiente
-        return lista
+        return list(self._nodos())
+
+    # ---------- Autoguardado incremental ----------
+
+    @property
+    def modificada(self):
+        return self.cambios_sin_guardar > 0
+
+    def _anotar(self, *campos):
+        self.cambios_sin_guardar += 1
+        if self._escritor is None:
+            return
+        self._escritor.anotar("\t".join(campos) + "\n")
+        self._cambios_registrados += 1
+        # Compactar cuando el registro alcanza el tamaño de la lista deja un costo amortizado O(1)
+        if self._cambios_registrados >= max(self.compactar_cada, len(self)):
+            self.compactar()
+
+    def _guardar_completo(self, archivo):
+        temporal = archivo + ".tmp"
+        if archivo.endswith(".lrb"):
+            self.guardar_binario(temporal)
+        else:
+            self.guardar_lista(temporal)
+        with open(temporal, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(temporal, archivo)  # El archivo anterior sigue intacto hasta este punto
+        self._marcar_guardada(archivo)
+
+    def _marcar_guardada(self, archivo):
+        self.cambios_sin_guardar = 0
+        self._origen = archivo
+
+    def activar_autoguardado(self, archivo, compactar_cada=1000):
+        """
+        Desde ahora cada cambio se agrega a archivo + ".cambios" en segundo plano. Si la lista
+        no es exactamente el contenido de `archivo` (más su registro), primero se guarda completa.
+        """
+        self.desactivar_autoguardado()
+        self.compactar_cada = compactar_cada
+        ruta = archivo + ".cambios"
+        if self._origen != archivo or self.modificada or not os.path.exists(archivo):
+            self._guardar_completo(archivo)
+        cabecera = _cabecera_de(archivo)
+        continuar = False
+        if os.path.exists(ruta):
+            with open(ruta, encoding="utf-8") as f:
+                continuar = f.readline() == cabecera
+        self._archivo_autoguardado = archivo
+        self._cambios_registrados = 0
+        self._escritor = EscritorCambios(ruta, None if continuar else cabecera)
+
+    def compactar(self):
+        """Guarda la lista completa y vacía el registro de cambios"""
+        if self._escritor is None:
+            return
+        self._guardar_completo(self._archivo_autoguardado)
+        self._escritor.reiniciar(_cabecera_de(self._archivo_autoguardado))
+        self._cambios_registrados = 0
+
+    def desactivar_autoguardado(self):
+        if self._escritor is not None:
+            escritor, self._escritor = self._escritor, None
+            escritor.cerrar()
+
+    def recuperar(self, archivo):
+        """
+        Carga `archivo` y le aplica su registro de cambios, si es de esa versión del archivo.
+        Devuelve la cantidad de cambios aplicados.
+        """
+        if archivo.endswith(".lrb"):
+            self.cargar_binario(archivo)
+        else:
+            self.cargar_lista(archivo)
+        aplicados = 0
+        ruta = archivo + ".cambios"
+        if os.path.exists(ruta):
+            with open(ruta, encoding="utf-8") as f:
+                if f.readline() == _cabecera_de(archivo):
+                    for linea in f:
+                        if not linea.endswith("\n"):
+                            break  # Última línea a medio escribir
+                        operacion, _, resto = linea[:-1].partition("\t")
+                        if operacion == "+":
+                            self.agregar_cancion(resto)
+                        elif operacion == "-":
+                            self.eliminar_cancion(resto)
+                        elif operacion == "i":
+                            indice, _, nombre = resto.partition("\t")
+                            self.insertar_cancion(int(indice), nombre)
+                        elif operacion == "x":
+                            self.eliminar_en(int(resto))
+                        aplicados += 1
+        self._marcar_guardada(archivo)
+        return aplicados
+
+    def guardar_lista(self, archivo, bloque=4096):
+        # Recorre la cadena sin armar una lista y escribe de a `bloque` canciones
+        with open(archivo, 'w', buffering=1 << 20) as f:
+            pendiente = []
+            for cancion in self._nodos():
+                pendiente.append(cancion.nombre)
+                if len(pendiente) == bloque:
+                    pendiente.append('')
+                    f.write('\n'.join(pendiente))
+                    pendiente.clear()
+            if pendiente:
+                pendiente.append('')
+                f.write('\n'.join(pendiente))
+        self._marcar_guardada(archivo)
 
-    def guardar_lista(self, archivo):
-        with open(archivo, 'w') as f:
-            for cancion in self.obtener_lista():
-                f.write(cancion.nombre + '\n')
+    def guardar_binario(self, archivo):
+        self._completar()  # Por si se guarda sobre el mismo archivo que se está leyendo
+        ArchivoListaBinaria.guardar((cancion.nombre for cancion in self._nodos()), archivo)
+        self._marcar_guardada(archivo)
+
+    def cargar_binario(self, archivo):
+        """Abre una lista binaria: solo se crean las canciones a medida que se recorren"""
+        self._completar()
+        self._fuente = ArchivoListaBinaria(archivo)
+        self._pendiente = 0
+        if not len(self._fuente):
+            self._fuente.cerrar()
+            self._fuente = None
+            return
+        self._materializar(self.BLOQUE_PEREZOSO)
 
     def cargar_lista(self, archivo):
         with open(archivo, 'r') as f:
             for linea in f:
                 self.agregar_cancion(linea.strip())
 
+class VisorLista:
+    """
+    Ventana con la lista de canciones que solo crea las filas visibles. Desplazarse de a una
+    fila o de a una página avanza nodo por nodo desde la página anterior, así que abrirla o
+    recorrerla no depende del largo de la lista. El índice de posiciones solo se construye al
+    saltar a una fila cualquiera (arrastrar la barra o ir a la canción actual).
+    """
+    def __init__(self, interfaz, alto=20):
+        self.interfaz = interfaz
+        self.alto = alto
+        self.inicio = 0
+        self.nodo = None  # Canción de la fila `inicio`, punto de partida del próximo desplazamiento
+        self._version = None  # (lista, _version_filas) con que se resolvió self.nodo
+        self.visibles = []  # Canciones de las filas mostradas
+        self.ventana = tk.Toplevel(interfaz.root)
+        self.ventana.title("📜 Lista de Reproducción")
+        self.ventana.configure(bg='#d0e1f9')
+
+        marco = tk.Frame(self.ventana, bg='#d0e1f9')
+        marco.pack(padx=10, pady=10)
+        self.filas = tk.Listbox(marco, width=50, height=alto, font=("Helvetica", 11), activestyle="none")
+        self.filas.pack(side="left")
+        self.barra = tk.Scrollbar(marco, orient="vertical", command=self.desplazar)
+        self.barra.pack(side="right", fill="y")
+        self.filas.bind("<MouseWheel>", lambda e: self.desplazar("scroll", -1 if e.delta > 0 else 1, "units"))
+        self.filas.bind("<Button-4>", lambda e: self.desplazar("scroll", -1, "units"))
+        self.filas.bind("<Button-5>", lambda e: self.desplazar("scroll", 1, "units"))
+        self.filas.bind("<Double-Button-1>", self.reproducir)
+        # La lista puede cambiar mientras la ventana está abierta: al volver a ella se redibuja
+        self.ventana.bind("<FocusIn>", lambda e: self.refrescar())
+
+        tk.Button(self.ventana, text="🎯 Ir a la Canción Actual", command=self.ir_a_actual,
+                  bg='#88c9bf', font=("Helvetica", 11, "bold")).pack(pady=(0, 10))
+        self.centrar()
+
+    def refrescar(self):
+        # <FocusIn> también llega por cada widget hijo: si desde entonces no se quitó ni insertó
+        # nada antes del final, self.nodo sigue en la fila `inicio` y redibujar cuesta O(alto).
+        # Si no, la canción pudo moverse o borrarse y la fila se vuelve a buscar
+        lista = self.interfaz.lista
+        if self._version != (lista, lista._version_filas):
+            self.nodo = None
+        self.mostrar(self.inicio)
+
+    def centrar(self):
+        # Con el índice de posiciones ya construido, centrar la canción actual es O(log n); sin
+        # él se muestra la página en la que estaba la ventana (la primera al abrirla)
+        if self.interfaz.lista._rango is not None and self.interfaz.lista.actual:
+            self.ir_a_actual()
+        else:
+            self.refrescar()
+
+    def _cancion_en(self, inicio, saltar):
+        lista = self.interfaz.lista
+        if saltar or lista._rango is not None:
+            return lista._indice_rango().en(inicio)
+        # Sin índice: se camina desde la página anterior (o desde la primera canción)
+        desde, nodo = (self.inicio, self.nodo) if self.nodo is not None else (0, lista.primera)
+        while desde > inicio:
+            nodo = nodo.anterior
+            desde -= 1
+        if desde < inicio:
+            nodo = next(itertools.islice(lista._nodos(nodo), inicio - desde, None))
+        return nodo
+
+    def mostrar(self, inicio, saltar=False):
+        lista = self.interfaz.lista
+        total = len(lista)
+        inicio = max(0, min(inicio, total - self.alto))
+        self.nodo = self._cancion_en(inicio, saltar) if total else None
+        self.inicio = inicio
+        self._version = (lista, lista._version_filas)
+        self.visibles = list(itertools.islice(lista._nodos(self.nodo), self.alto)) if total else []
+        self.filas.delete(0, tk.END)
+        for fila, cancion in enumerate(self.visibles):
+            self.filas.insert(tk.END, f"{inicio + fila + 1}. {cancion.nombre}")
+            if cancion is lista.actual:
+                self.filas.itemconfig(fila, bg='#88c9bf')
+        if total:
+            self.barra.set(inicio / total, min(1.0, (inicio + self.alto) / total))
+        else:
+            self.barra.set(0.0, 1.0)
+
+    def desplazar(self, accion, cantidad, unidad=None):
+        """Atiende la barra y la rueda del ratón moviendo la página visible"""
+        if accion == "moveto":
+            self.mostrar(int(float(cantidad) * len(self.interfaz.lista)), saltar=True)
+        else:
+            paso = self.alto if unidad == "pages" else 1
+            self.mostrar(self.inicio + int(cantidad) * paso)
+        return "break"
+
+    def ir_a_actual(self):
+        posicion = self.interfaz.lista.posicion_actual()
+        self.mostrar(0 if posicion is None else posicion - self.alto // 2, saltar=posicion is not None)
+
+    def reproducir(self, evento):
+        seleccion = self.filas.curselection()
+        if seleccion:
+            # La canción de la fila ya se conoce: no hace falta buscarla por posición
+            self.interfaz.lista.actual = self.visibles[seleccion[0]]
+            self.interfaz.actualizar_etiqueta()
+            self.mostrar(self.inicio)
+
+TIPOS_ARCHIVO = [("Lista de texto", "*.txt"), ("Lista binaria", "*.lrb"), ("Todos los archivos", "*.*")]
+
 class Interfaz:
     def __init__(self, root):
         self.root = root
         self.root.title("🎵 Reproductor de Música Creativo 🎵")
-        self.root.geometry("600x500")
+        self.root.geometry("600x540")
         self.root.configure(bg='#d0e1f9')
 
         self.lista = ListaReproduccion()
+        self.visor = None
+        self.root.protocol("WM_DELETE_WINDOW", self.cerrar)
 
         self.etiqueta = tk.Label(root, text="🎶 Canción actual: Ninguna", font=("Helvetica", 14), bg='#d0e1f9', fg='#003366')
         self.etiqueta.pack(pady=15)
@@ -102,6 +914,7 @@ class Interfaz:
             ("🔁 Repetir", self.repetir),
             ("🔀 Modo Aleatorio", self.toggle_aleatorio),
             ("🔍 Buscar Canción", self.buscar),
+            ("🔢 Ir a Posición", self.ir_a),
             ("📜 Mostrar Lista", self.mostrar_lista),
             ("💾 Guardar Lista", self.guardar),
             ("📂 Cargar Lista", self.cargar),
@@ -155,27 +968,51 @@ class Interfaz:
             msg = "encontrada ✅" if encontrado else "no está ❌"
             messagebox.showinfo("Buscar", f"La canción {msg}.")
 
+    def ir_a(self):
+        if not len(self.lista):
+            messagebox.showinfo("Ir a", "La lista está vacía.")
+            return
+        actual = self.lista.posicion_actual()
+        posicion = simpledialog.askinteger(
+            "Ir a", f"Posición (1-{len(self.lista)}), actual: {actual + 1}:",
+            minvalue=1, maxvalue=len(self.lista))
+        if posicion:
+            self.lista.ir_a(posicion - 1)
+            self.actualizar_etiqueta()
+
     def mostrar_lista(self):
-        canciones = [c.nombre for c in self.lista.obtener_lista()]
-        if canciones:
-            messagebox.showinfo("Lista", "\n".join(canciones))
-        else:
+        if not len(self.lista):
             messagebox.showinfo("Lista", "La lista está vacía.")
+        elif self.visor and self.visor.ventana.winfo_exists():
+            self.visor.ventana.lift()
+            self.visor.centrar()
+        else:
+            self.visor = VisorLista(self)
 
     def guardar(self):
-        archivo = filedialog.asksaveasfilename(defaultextension=".txt")
+        archivo = filedialog.asksaveasfilename(defaultextension=".txt", filetypes=TIPOS_ARCHIVO)
         if archivo:
-            self.lista.guardar_lista(archivo)
+            if archivo.endswith(".lrb"):
+                self.lista.guardar_binario(archivo)
+            else:
+                self.lista.guardar_lista(archivo)
+            self.lista.activar_autoguardado(archivo)  # Desde ahora solo se escriben los cambios
             messagebox.showinfo("Guardar", "Lista guardada exitosamente.")
 
     def cargar(self):
-        archivo = filedialog.askopenfilename()
+        archivo = filedialog.askopenfilename(filetypes=TIPOS_ARCHIVO)
         if archivo:
+            self.lista.desactivar_autoguardado()
             self.lista = ListaReproduccion()
-            self.lista.cargar_lista(archivo)
+            self.lista.recuperar(archivo)  # Incluye los cambios autoguardados desde el último guardado
+            self.lista.activar_autoguardado(archivo)
             self.actualizar_etiqueta()
             messagebox.showinfo("Cargar", "Lista cargada correctamente.")
 
+    def cerrar(self):
+        self.lista.desactivar_autoguardado()  # Espera a que el registro de cambios llegue a disco
+        self.root.destroy()
+
 if __name__ == "__main__":
     root = tk.Tk()
     app = Interfaz(root)
@@ -6,49 +6,870 @@ import tkinter as tk  # Biblioteca principal para crear interfaces gráficas en
 from tkinter import ttk  # Widgets modernos (como botones estilizados)
 from tkinter import messagebox  # Para mostrar mensajes emergentes al usuario
 from tkinter import simpledialog  # Para solicitar entradas mediante cuadros emergentes
-import heapq  # Proporciona una estructura de datos tipo heap para implementar la cola de prioridad
+import gc  # Pausa del recolector cíclico al reconstruir el índice en bloque
+import heapq  # heappush/heappop/heapify en C para la cola de prioridad
+import itertools  # Contadores de orden y de llegada de las entradas
+import bisect  # Inserción ordenada en el espejo que muestra la interfaz
+import threading  # Candados y condiciones para la cola concurrente
+import asyncio  # Variantes async de encolar/desencolar para servicios asyncio
+import json  # Formato de cada línea del archivo de historial
+from json.encoder import encode_basestring  # Nombre como cadena JSON sin pasar por json.dumps
+import os  # Rutas, fsync y reemplazo atómico de archivos de persistencia
+import struct  # Registros binarios del diario y del snapshot
+import time  # Intervalo máximo entre fsync del diario
+import tempfile  # Archivo temporal para el historial cuando no se indica uno
+from array import array  # Desplazamientos compactos de los bloques volcados a disco
+from collections import deque  # Buffer circular con las entradas recientes del historial
+from collections import OrderedDict  # Registros de un nombre repetido: quitar y primero en O(1)
+from contextlib import contextmanager  # Para el bloque que pausa el recolector de basura
 
 # ===============================
 # LÓGICA DE LA COLA DE PRIORIDAD
 # ===============================
 
+@contextmanager
+def sin_recolector():
+    """
+    Pausa el recolector cíclico mientras se crean en bloque millones de tuplas y listas
+    sin ciclos; si no, lo recorre todo una y otra vez durante la construcción.
+    """
+    activo = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if activo:
+            gc.enable()
+
+
+class HistorialAcotado:
+    """
+    Historial de elementos desencolados con memoria acotada.
+    Las `capacidad` entradas más recientes viven en un buffer circular; las más antiguas
+    se vuelcan en bloques a un archivo de solo-anexado y se consultan por páginas. Del archivo
+    solo se recuerda el byte de inicio de cada bloque de BLOQUE_VOLCADO entradas: una página
+    se lee desde el bloque donde empieza y se descartan las líneas sobrantes.
+    """
+
+    BLOQUE_VOLCADO = 256  # Entradas expulsadas que se acumulan antes de escribir a disco
+
+    def __init__(self, capacidad=1000, archivo=None):
+        self.capacidad = capacidad
+        self.recientes = deque()  # Entradas más nuevas, como máximo `capacidad`
+        self._pendientes = []  # Expulsadas del buffer y aún no escritas
+        self._desplazamientos = array("q")  # Byte de inicio de cada bloque de entradas en disco
+        self._en_disco = 0  # Entradas escritas en el archivo
+        self._fin = 0  # Tamaño en bytes de lo escrito en el archivo
+        if archivo is None:
+            self._archivo = None  # Temporal que se crea con el primer volcado
+        else:
+            self._archivo = open(archivo, "a+b")
+            self._indexar_existente()
+
+    def _indexar_existente(self):
+        # Recupera los desplazamientos de un archivo de historial de una ejecución anterior
+        self._archivo.seek(0)
+        for linea in self._archivo:
+            self._anotar_linea(len(linea))
+
+    def _anotar_linea(self, largo):
+        if self._en_disco % self.BLOQUE_VOLCADO == 0:
+            self._desplazamientos.append(self._fin)
+        self._en_disco += 1
+        self._fin += largo
+
+    def _escribir_pendientes(self):
+        if not self._pendientes:
+            return
+        if self._archivo is None:
+            self._archivo = tempfile.TemporaryFile()  # Se borra solo al cerrarse
+        lineas = []
+        for prioridad, nombre in self._pendientes:
+            # Mismo texto que json.dumps([prioridad, nombre], ensure_ascii=False), sin su costo
+            prioridad = prioridad if type(prioridad) is int else json.dumps(prioridad)
+            linea = f"[{prioridad}, {encode_basestring(nombre)}]\n".encode("utf-8")
+            self._anotar_linea(len(linea))
+            lineas.append(linea)
+        self._archivo.seek(0, 2)
+        self._archivo.write(b"".join(lineas))  # Una sola escritura por bloque
+        self._pendientes.clear()
+
+    def append(self, elemento):
+        self.recientes.append(elemento)
+        if len(self.recientes) > self.capacidad:
+            self._pendientes.append(self.recientes.popleft())
+            if len(self._pendientes) >= self.BLOQUE_VOLCADO:
+                self._escribir_pendientes()
+
+    def extend(self, elementos):
+        for elemento in elementos:
+            self.append(elemento)
+
+    def __len__(self):
+        return self._en_disco + len(self._pendientes) + len(self.recientes)
+
+    def __iter__(self):
+        # Recorre el archivo bloque a bloque sin cargarlo entero y después las recientes
+        self._escribir_pendientes()
+        en_disco, recientes = self._en_disco, tuple(self.recientes)
+        for inicio in range(0, en_disco, self.BLOQUE_VOLCADO):
+            yield from self._leer_disco(inicio, min(inicio + self.BLOQUE_VOLCADO, en_disco))
+        yield from recientes
+
+    def _leer_disco(self, inicio, fin):
+        # Lee las entradas [inicio, fin) del archivo con una sola lectura contigua, desde el
+        # bloque que contiene `inicio` hasta el que sigue al que contiene `fin - 1`
+        self._archivo.flush()
+        primero, ultimo = inicio // self.BLOQUE_VOLCADO, (fin - 1) // self.BLOQUE_VOLCADO + 1
+        desde = self._desplazamientos[primero]
+        hasta = self._desplazamientos[ultimo] if ultimo < len(self._desplazamientos) else self._fin
+        self._archivo.seek(desde)
+        lineas = self._archivo.read(hasta - desde).splitlines()
+        base = primero * self.BLOQUE_VOLCADO
+        return [tuple(json.loads(linea)) for linea in lineas[inicio - base:fin - base]]
+
+    def pagina(self, inicio, cantidad):
+        """Devuelve hasta `cantidad` entradas a partir de la posición `inicio` (0 = la más antigua)"""
+        self._escribir_pendientes()
+        fin = min(inicio + cantidad, len(self))
+        en_disco = self._en_disco
+        resultado = []
+        if inicio < en_disco:
+            resultado.extend(self._leer_disco(inicio, min(fin, en_disco)))
+        for i in range(max(inicio, en_disco), fin):
+            resultado.append(self.recientes[i - en_disco])
+        return resultado
+
+    def cerrar(self):
+        # Al cerrar también se escriben las recientes para no perderlas si el archivo es persistente
+        if self._archivo is None:
+            # Sin archivo propio y sin volcados todavía: no hay nada que conservar
+            self._pendientes.clear()
+            self.recientes.clear()
+            return
+        self._pendientes.extend(self.recientes)
+        self.recientes.clear()
+        self._escribir_pendientes()
+        self._archivo.close()
+
+
+# Campos de cada entrada del heap. Las tuplas se comparan por prioridad, nombre y orden (único),
+# así que heapq nunca llega a la llegada; una entrada cuyo orden está en _obsoletas ya no cuenta.
+PRIORIDAD, NOMBRE, ORDEN, LLEGADA = range(4)
+
+
 class ColaPrioridad:
-    def __init__(self):
-        self.cola = []  # Cola principal: almacena tuplas (prioridad, nombre)
-        self.historial = []  # Guarda los elementos desencolados
+    """
+    Heap de entradas (prioridad, nombre, orden, llegada) manejado con heapq (en C) y un índice
+    nombre en minúsculas -> entrada. Editar no reubica la entrada: la marca obsoleta y encola
+    una nueva con la misma llegada; desencolar descarta las obsoletas al sacarlas.
+    """
+
+    def __init__(self, capacidad_historial=1000, archivo_historial=None):
+        self._heap = []  # Entradas vigentes y obsoletas
+        self.historial = HistorialAcotado(capacidad_historial, archivo_historial)  # Elementos desencolados
+        # Índice nombre en minúsculas -> entrada vigente con ese nombre o, si el nombre se repite,
+        # OrderedDict llegada -> entrada en orden de llegada
+        self._indice = {}
+        self._obsoletas = set()  # Orden de las entradas editadas que siguen en el heap
+        self._orden = itertools.count()  # Desempate único entre entradas con igual prioridad y nombre
+        self._llegadas = itertools.count(1)  # Número de llegada de cada elemento encolado
+        self._suma = 0  # Suma de prioridades en cola, mantenida en cada operación
+
+    # ---------- Entradas e índice ----------
+
+    def _indexar(self, entrada, clave):
+        actual = self._indice.get(clave)
+        if actual is None:
+            self._indice[clave] = entrada
+        elif type(actual) is tuple:
+            # Segundo elemento con el mismo nombre: la entrada suelta pasa a un OrderedDict
+            self._indice[clave] = OrderedDict(((actual[LLEGADA], actual), (entrada[LLEGADA], entrada)))
+        else:
+            actual[entrada[LLEGADA]] = entrada
+
+    def _desindexar(self, entrada):
+        clave = entrada[NOMBRE].lower()
+        actual = self._indice[clave]
+        if actual is entrada:
+            del self._indice[clave]
+            return
+        del actual[entrada[LLEGADA]]
+        if len(actual) == 1:
+            self._indice[clave] = next(iter(actual.values()))  # Vuelve a ser una entrada suelta
+
+    def _entrada(self, nombre):
+        """
+        Entrada vigente a la que se refieren buscar, obtener y editar, o None. Si varios
+        elementos comparten el nombre (sin distinguir mayúsculas) es el que llegó primero de
+        los que siguen en la cola. Se obtiene en O(1) sin recorrer los repetidos.
+        """
+        actual = self._indice.get(nombre.lower())
+        if actual is None or type(actual) is tuple:
+            return actual
+        return next(iter(actual.values()))
+
+    def _vigentes(self):
+        return (entrada for entrada in self._heap if entrada[ORDEN] not in self._obsoletas)
+
+    def _sacar(self):
+        # Quita y devuelve la tupla (prioridad, nombre) de menor prioridad, o None si no hay
+        heap, obsoletas = self._heap, self._obsoletas
+        while heap:
+            entrada = heapq.heappop(heap)
+            if obsoletas and entrada[ORDEN] in obsoletas:
+                obsoletas.remove(entrada[ORDEN])
+                continue
+            self._desindexar(entrada)
+            self._suma -= entrada[PRIORIDAD]
+            return entrada[:2]
+        return None
+
+    def _cambiar_prioridad(self, entrada, nueva_prioridad):
+        # La entrada vieja queda obsoleta en el heap y la nueva ocupa su lugar en el índice: O(log n)
+        nueva = (nueva_prioridad, entrada[NOMBRE], next(self._orden), entrada[LLEGADA])
+        clave = entrada[NOMBRE].lower()
+        actual = self._indice[clave]
+        if actual is entrada:
+            self._indice[clave] = nueva
+        else:
+            actual[entrada[LLEGADA]] = nueva  # Misma llegada: conserva su lugar entre los repetidos
+        self._obsoletas.add(entrada[ORDEN])
+        self._suma += nueva_prioridad - entrada[PRIORIDAD]
+        heapq.heappush(self._heap, nueva)
+        if len(self._obsoletas) > len(self) + 64:
+            self._compactar()
+
+    def _compactar(self):
+        # Con más obsoletas que vigentes se rehace el heap solo con las vigentes: O(n) amortizado
+        self._heap[:] = list(self._vigentes())
+        heapq.heapify(self._heap)
+        self._obsoletas.clear()
+
+    def _extraer_lote(self, k):
+        # Quita los k primeros sin tocar el historial
+        if k <= 0 or not len(self):
+            return []
+        if k * 4 < len(self):
+            return [self._sacar() for _ in range(k)]
+        # Extraer una fracción grande: ordenar una vez; el resto ordenado ya es un heap
+        ordenadas = sorted(self._vigentes())
+        lote = ordenadas[:k]
+        self._heap[:] = ordenadas[k:]
+        self._obsoletas.clear()
+        for entrada in lote:
+            self._desindexar(entrada)
+        self._suma -= sum(entrada[PRIORIDAD] for entrada in lote)
+        return [entrada[:2] for entrada in lote]
+
+    # ---------- Operaciones públicas ----------
+
+    @property
+    def cola(self):
+        """Tuplas (prioridad, nombre) en cola, en el orden del arreglo del heap (copia en O(n))"""
+        return [entrada[:2] for entrada in self._vigentes()]
+
+    def __len__(self):
+        return len(self._heap) - len(self._obsoletas)
 
     def encolar(self, nombre, prioridad):
-        heapq.heappush(self.cola, (prioridad, nombre))  # Inserta elemento según prioridad
+        entrada = (prioridad, nombre, next(self._orden), next(self._llegadas))
+        heapq.heappush(self._heap, entrada)  # Inserta elemento según prioridad
+        self._indexar(entrada, nombre.lower())
+        self._suma += prioridad
 
     def desencolar(self):
-        if self.cola:
-            elemento = heapq.heappop(self.cola)  # Extrae el de mayor prioridad
+        elemento = self._sacar()  # Extrae el de mayor prioridad
+        if elemento is not None:
             self.historial.append(elemento)
-            return elemento
-        return None
+        return elemento
+
+    def encolar_lote(self, elementos):
+        """Encola un iterable de pares (nombre, prioridad) de una sola vez"""
+        with sin_recolector():
+            nuevas = [(prioridad, nombre, next(self._orden), next(self._llegadas)) for nombre, prioridad in elementos]
+            for entrada in nuevas:
+                self._indexar(entrada, entrada[NOMBRE].lower())
+        if len(nuevas) * 4 < len(self._heap):
+            # Lote pequeño frente a la cola: inserciones individuales O(k log n)
+            for entrada in nuevas:
+                heapq.heappush(self._heap, entrada)
+        else:
+            # Lote grande o cola vacía: un solo heapify O(n + k)
+            self._heap.extend(nuevas)
+            heapq.heapify(self._heap)
+        self._suma += sum(entrada[PRIORIDAD] for entrada in nuevas)
+
+    def desencolar_lote(self, k):
+        """Extrae hasta k elementos en orden de prioridad y los devuelve en una lista"""
+        lote = self._extraer_lote(k)
+        self.historial.extend(lote)
+        return lote
+
+    def drenar(self, k=None):
+        """
+        Generador que extrae de una vez los k primeros elementos (todos si k es None), igual
+        que desencolar_lote, y los entrega de a uno. Si se deja de iterar antes de terminar,
+        los que no se entregaron vuelven a la cola.
+        """
+        lote = self._extraer_para_drenar(len(self) if k is None else k)
+        entregados = 0
+        try:
+            for elemento in lote:
+                self.historial.append(elemento)
+                entregados += 1
+                yield elemento
+        finally:
+            if entregados < len(lote):
+                self.encolar_lote((nombre, prioridad) for prioridad, nombre in lote[entregados:])
+
+    def _extraer_para_drenar(self, k):
+        return self._extraer_lote(k)
+
+    def obtener(self, nombre):
+        """Devuelve la tupla (prioridad, nombre) guardada para ese nombre o None"""
+        entrada = self._entrada(nombre)
+        return None if entrada is None else entrada[:2]
 
     def buscar(self, nombre):
-        for i, (p, n) in enumerate(self.cola):
-            if n.lower() == nombre.lower():
-                return (i + 1, p)  # Devuelve posición y prioridad
-        return None
+        """
+        Devuelve (llegada, prioridad) o None; llegada es el número de orden en que el elemento
+        entró a la cola (1 = el primero), ya que heapq no informa dónde queda cada entrada
+        """
+        entrada = self._entrada(nombre)  # Consulta O(1) en el índice
+        if entrada is None:
+            return None
+        return (entrada[LLEGADA], entrada[PRIORIDAD])
 
     def editar(self, nombre, nueva_prioridad):
-        for i, (p, n) in enumerate(self.cola):
-            if n.lower() == nombre.lower():
-                self.cola[i] = (nueva_prioridad, n)
-                heapq.heapify(self.cola)  # Reorganiza el heap después del cambio
-                return True
-        return False
+        entrada = self._entrada(nombre)
+        if entrada is None:
+            return False
+        self._cambiar_prioridad(entrada, nueva_prioridad)
+        return True
 
     def vaciar(self):
-        self.cola.clear()
+        self._heap.clear()
+        self._indice.clear()
+        self._obsoletas.clear()
+        self._suma = 0
+
+    def cerrar(self):
+        self.historial.cerrar()  # Vuelca el historial pendiente y cierra su archivo
 
     def obtener_estadisticas(self):
-        if not self.cola:
+        # O(1) amortizado: el mínimo es la primera entrada vigente y la suma se mantiene al día
+        total = len(self)
+        if not total:
             return (0, "N/A", "N/A")
-        prioridades = [p for p, _ in self.cola]
-        return (len(self.cola), min(prioridades), sum(prioridades) / len(prioridades))
+        while self._heap[0][ORDEN] in self._obsoletas:
+            self._obsoletas.remove(heapq.heappop(self._heap)[ORDEN])
+        return (total, self._heap[0][PRIORIDAD], self._suma / total)
+
+# ===============================
+# PERSISTENCIA: SNAPSHOT + DIARIO
+# ===============================
+
+# Operaciones registradas en el diario binario
+# (OP_EDITAR solo aparece en diarios anteriores: guardaba el nombre y no qué elemento se editó)
+OP_ENCOLAR, OP_DESENCOLAR, OP_EDITAR, OP_VACIAR, OP_DESENCOLAR_LOTE, OP_EDITAR_ELEMENTO = 1, 2, 3, 4, 5, 6
+
+_MAGIA_DIARIO = b"CPD1"
+_MAGIA_SNAPSHOT = b"CPS1"
+_GENERACION = struct.Struct("<Q")  # Generación del snapshot al que pertenece un diario
+_REGISTRO = struct.Struct("<BB8sI")  # Operación, tipo de prioridad, prioridad, largo del nombre
+_EDICION = struct.Struct("<BB8sB8sI")  # Operación, prioridad anterior y nueva (tipo y valor), largo del nombre
+_SNAPSHOT = struct.Struct("<QQc")  # Generación, cantidad de elementos, tipo de las prioridades
+
+
+def _codificar_prioridad(prioridad):
+    # Las prioridades enteras se guardan como int64 y el resto como double
+    try:
+        if isinstance(prioridad, int):
+            return b"q", struct.pack("<q", prioridad)
+        return b"d", struct.pack("<d", prioridad)
+    except struct.error:
+        raise ValueError(f"Prioridad no persistible: {prioridad!r} (se admiten enteros de 64 bits "
+                         "y números reales)") from None
+
+
+def _decodificar_prioridad(tipo, crudo):
+    return struct.unpack("<q" if tipo == ord("q") else "<d", crudo)[0]
+
+
+class ColaPersistente(ColaPrioridad):
+    """
+    ColaPrioridad durable. Cada encolar/desencolar/editar/vaciar se añade a un diario
+    binario compacto (fsync por lotes) y cada cierto número de operaciones se guarda un
+    snapshot con los elementos en cola. Al abrirse, la cola se reconstruye con el último
+    snapshot (un solo heapify) más la cola del diario. Los números de llegada que informa
+    buscar se renumeran al recuperar, conservando el orden entre elementos del mismo nombre.
+    El historial de desencolados no forma parte de lo persistido.
+    """
+
+    def __init__(self, directorio, fsync_cada=64, intervalo_fsync=1.0, snapshot_cada=100000, **kwargs):
+        super().__init__(**kwargs)
+        os.makedirs(directorio, exist_ok=True)
+        self.directorio = directorio
+        self.ruta_snapshot = os.path.join(directorio, "cola.snapshot")
+        self.ruta_diario = os.path.join(directorio, "cola.diario")
+        self.fsync_cada = fsync_cada  # Registros que pueden quedar sin fsync
+        self.intervalo_fsync = intervalo_fsync  # Segundos que pueden pasar sin fsync
+        self.snapshot_cada = snapshot_cada  # Registros del diario que disparan un snapshot
+        self._generacion = 0
+        self._registros_diario = 0
+        self._sin_sincronizar = 0
+        self._ultimo_fsync = time.monotonic()
+        self._diario = None
+        self._recuperar()
+
+    # ---------- Recuperación ----------
+
+    def _recuperar(self):
+        if os.path.exists(self.ruta_snapshot):
+            self._cargar_snapshot()
+        if os.path.exists(self.ruta_diario):
+            with open(self.ruta_diario, "r+b") as f:
+                datos = f.read()
+                if datos[:4] == _MAGIA_DIARIO and _GENERACION.unpack_from(datos, 4)[0] == self._generacion:
+                    valido = self._reproducir(datos)
+                    f.truncate(valido)  # Descarta un registro final incompleto
+                    self._diario = open(self.ruta_diario, "ab")
+        if self._diario is None:
+            # No hay diario o pertenece a un snapshot anterior (ya incluido en el actual)
+            self._nuevo_diario()
+
+    def _cargar_snapshot(self):
+        with open(self.ruta_snapshot, "rb") as f:
+            datos = f.read()
+        if datos[:4] != _MAGIA_SNAPSHOT:
+            raise ValueError(f"{self.ruta_snapshot} no es un snapshot de la cola")
+        self._generacion, cantidad, tipo = _SNAPSHOT.unpack_from(datos, 4)
+        pos = 4 + _SNAPSHOT.size
+        prioridades = array(tipo.decode())
+        prioridades.frombytes(datos[pos:pos + 8 * cantidad])
+        pos += 8 * cantidad
+        prioridades = prioridades.tolist()
+        if tipo == b"d":
+            # Prioridades mixtas: una máscara indica cuáles eran enteras
+            mascara = datos[pos:pos + cantidad]
+            pos += cantidad
+            prioridades = [int(p) if m else p for p, m in zip(prioridades, mascara)]
+        nombres = datos[pos:].decode("utf-8").split("\x00") if cantidad else []
+        # Un solo heapify; los repetidos de cada nombre se guardaron en orden de llegada
+        ColaPrioridad.encolar_lote(self, zip(nombres, prioridades))
+
+    def _reproducir(self, datos):
+        # Aplica los registros del diario; devuelve el byte donde termina el último completo
+        pos = valido = 4 + _GENERACION.size
+        pendientes = []  # Encolados consecutivos: se aplican juntos con encolar_lote
+
+        def aplicar_pendientes():
+            if pendientes:
+                ColaPrioridad.encolar_lote(self, pendientes)
+                pendientes.clear()
+
+        while pos < len(datos):
+            op = datos[pos]
+            if op in (OP_ENCOLAR, OP_EDITAR):
+                if pos + _REGISTRO.size > len(datos):
+                    break
+                _, tipo, crudo, largo = _REGISTRO.unpack_from(datos, pos)
+                fin = pos + _REGISTRO.size + largo
+                if fin > len(datos):
+                    break
+                prioridad = _decodificar_prioridad(tipo, crudo)
+                nombre = datos[pos + _REGISTRO.size:fin].decode("utf-8")
+                if op == OP_ENCOLAR:
+                    pendientes.append((nombre, prioridad))
+                else:
+                    aplicar_pendientes()
+                    ColaPrioridad.editar(self, nombre, prioridad)
+            elif op == OP_EDITAR_ELEMENTO:
+                if pos + _EDICION.size > len(datos):
+                    break
+                _, tipo_anterior, anterior, tipo, crudo, largo = _EDICION.unpack_from(datos, pos)
+                fin = pos + _EDICION.size + largo
+                if fin > len(datos):
+                    break
+                nombre = datos[pos + _EDICION.size:fin].decode("utf-8")
+                aplicar_pendientes()
+                self._editar_elemento((_decodificar_prioridad(tipo_anterior, anterior), nombre),
+                                      _decodificar_prioridad(tipo, crudo))
+            elif op == OP_DESENCOLAR_LOTE:
+                fin = pos + 1 + 8
+                if fin > len(datos):
+                    break
+                aplicar_pendientes()
+                self._extraer_lote(struct.unpack_from("<Q", datos, pos + 1)[0])
+            elif op == OP_DESENCOLAR:
+                fin = pos + 1
+                aplicar_pendientes()
+                self._sacar()
+            elif op == OP_VACIAR:
+                fin = pos + 1
+                pendientes.clear()
+                ColaPrioridad.vaciar(self)
+            else:
+                break  # Byte desconocido: el resto del diario está corrupto
+            pos = valido = fin
+            self._registros_diario += 1
+        aplicar_pendientes()
+        return valido
+
+    def _editar_elemento(self, elemento, nueva_prioridad):
+        # Edita un elemento igual a `elemento`: con la tupla exacta el resultado no depende de
+        # cuál de los repetidos elija el índice. Recorre los repetidos del nombre: solo se usa
+        # al recuperar.
+        actual = self._indice.get(elemento[1].lower())
+        entradas = (actual,) if type(actual) is tuple else actual.values() if actual else ()
+        for entrada in entradas:
+            if entrada[:2] == elemento:
+                self._cambiar_prioridad(entrada, nueva_prioridad)
+                return
+
+    # ---------- Diario y snapshots ----------
+
+    def _entradas_por_nombre(self):
+        for actual in self._indice.values():
+            if type(actual) is tuple:
+                yield actual
+            else:
+                yield from actual.values()
+
+    def _nuevo_diario(self):
+        # Crea un diario vacío para la generación actual, reemplazando el anterior de forma atómica
+        temporal = self.ruta_diario + ".tmp"
+        with open(temporal, "wb") as f:
+            f.write(_MAGIA_DIARIO + _GENERACION.pack(self._generacion))
+            f.flush()
+            os.fsync(f.fileno())
+        if self._diario is not None:
+            self._diario.close()
+        os.replace(temporal, self.ruta_diario)
+        _sincronizar_directorio(self.directorio)
+        self._diario = open(self.ruta_diario, "ab")
+        self._registros_diario = 0
+
+    def _registrar(self, op, nombre=None, prioridad=None, cantidad=None, anterior=None):
+        self._escribir(self._codificar_registro(op, nombre, prioridad, cantidad, anterior))
+        self._confirmar()
+
+    @staticmethod
+    def _codificar_registro(op, nombre=None, prioridad=None, cantidad=None, anterior=None):
+        # Falla con ValueError/UnicodeEncodeError si el dato no se puede persistir: las
+        # operaciones lo codifican antes de tocar la cola para no dejarla adelantada al diario
+        if op in (OP_ENCOLAR, OP_EDITAR):
+            tipo, crudo = _codificar_prioridad(prioridad)
+            nombre_bytes = nombre.encode("utf-8")
+            return _REGISTRO.pack(op, tipo[0], crudo, len(nombre_bytes)) + nombre_bytes
+        if op == OP_EDITAR_ELEMENTO:
+            # `anterior` es la tupla (prioridad, nombre) que tenía el elemento antes de editarlo
+            tipo_anterior, crudo_anterior = _codificar_prioridad(anterior[0])
+            tipo, crudo = _codificar_prioridad(prioridad)
+            nombre_bytes = nombre.encode("utf-8")
+            return (_EDICION.pack(op, tipo_anterior[0], crudo_anterior, tipo[0], crudo, len(nombre_bytes))
+                    + nombre_bytes)
+        if op == OP_DESENCOLAR_LOTE:
+            return bytes([op]) + struct.pack("<Q", cantidad)
+        return bytes([op])
+
+    def _escribir(self, registros, cantidad=1):
+        self._diario.write(registros)
+        self._registros_diario += cantidad
+        self._sin_sincronizar += cantidad
+
+    def _confirmar(self):
+        # Se llama cuando el diario ya refleja todo el estado en memoria
+        if (self._sin_sincronizar >= self.fsync_cada
+                or time.monotonic() - self._ultimo_fsync >= self.intervalo_fsync):
+            self.sincronizar()
+        if self._registros_diario >= self.snapshot_cada:
+            self.guardar_snapshot()
+
+    def sincronizar(self):
+        """Fuerza a disco los registros del diario pendientes"""
+        self._diario.flush()
+        os.fsync(self._diario.fileno())
+        self._sin_sincronizar = 0
+        self._ultimo_fsync = time.monotonic()
+
+    def guardar_snapshot(self):
+        """Escribe todos los elementos en cola y empieza un diario nuevo"""
+        self.sincronizar()
+        # Recorriendo el índice, los repetidos de cada nombre quedan en orden de llegada
+        elementos = [entrada[:2] for entrada in self._entradas_por_nombre()]
+        prioridades = [p for p, _ in elementos]
+        if all(type(p) is int for p in prioridades):
+            tipo, mascara = b"q", b""
+        else:
+            tipo = b"d"
+            mascara = bytes(type(p) is int for p in prioridades)
+        # Se codifica antes de abrir el temporal: un entero fuera de int64 (solo posible si se
+        # encoló sin pasar por esta clase) falla aquí sin dejar un snapshot a medias
+        try:
+            valores = array(tipo.decode(), prioridades).tobytes()
+        except OverflowError:
+            raise ValueError("Hay prioridades fuera de rango para el snapshot (enteros de 64 bits)") from None
+        generacion = self._generacion + 1
+        temporal = self.ruta_snapshot + ".tmp"
+        with open(temporal, "wb") as f:
+            f.write(_MAGIA_SNAPSHOT + _SNAPSHOT.pack(generacion, len(elementos), tipo))
+            f.write(valores)
+            f.write(mascara)
+            f.write("\x00".join(n for _, n in elementos).encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, self.ruta_snapshot)
+        _sincronizar_directorio(self.directorio)
+        # Si el proceso cae aquí, el diario viejo tiene otra generación y se ignora al recuperar
+        self._generacion = generacion
+        self._nuevo_diario()
+
+    def cerrar(self):
+        self.sincronizar()
+        self._diario.close()
+        super().cerrar()
+
+    # ---------- Operaciones registradas ----------
+
+    # Cada operación codifica su registro antes de modificar la cola: si el dato no se puede
+    # persistir la excepción sale sin cambios, y la cola nunca queda por delante del diario.
+
+    def encolar(self, nombre, prioridad):
+        if "\x00" in nombre:
+            raise ValueError("El nombre no puede contener el carácter nulo")
+        registro = self._codificar_registro(OP_ENCOLAR, nombre, prioridad)
+        super().encolar(nombre, prioridad)
+        self._escribir(registro)
+        self._confirmar()
+
+    def encolar_lote(self, elementos):
+        elementos = list(elementos)
+        if any("\x00" in nombre for nombre, _ in elementos):
+            raise ValueError("El nombre no puede contener el carácter nulo")
+        registros = b"".join(self._codificar_registro(OP_ENCOLAR, nombre, prioridad)
+                             for nombre, prioridad in elementos)
+        super().encolar_lote(elementos)
+        self._escribir(registros, len(elementos))
+        self._confirmar()
+
+    def desencolar(self):
+        elemento = super().desencolar()
+        if elemento is not None:
+            self._registrar(OP_DESENCOLAR)
+        return elemento
+
+    def desencolar_lote(self, k):
+        lote = super().desencolar_lote(k)
+        if lote:
+            self._registrar(OP_DESENCOLAR_LOTE, cantidad=len(lote))
+        return lote
+
+    def _extraer_para_drenar(self, k):
+        # Un solo registro para todo el lote; los que se devuelvan se registran como encolados
+        lote = super()._extraer_para_drenar(k)
+        if lote:
+            self._registrar(OP_DESENCOLAR_LOTE, cantidad=len(lote))
+        return lote
+
+    def editar(self, nombre, nueva_prioridad):
+        anterior = self.obtener(nombre)  # Se registra la tupla exacta del elemento editado
+        if anterior is None:
+            return False
+        registro = self._codificar_registro(OP_EDITAR_ELEMENTO, anterior[1], nueva_prioridad, anterior=anterior)
+        super().editar(nombre, nueva_prioridad)
+        self._escribir(registro)
+        self._confirmar()
+        return True
+
+    def vaciar(self):
+        super().vaciar()
+        self._registrar(OP_VACIAR)
+
+
+def _sincronizar_directorio(directorio):
+    # Asegura que los renombrados del directorio lleguen a disco (no aplica en Windows)
+    if os.name == "nt":
+        return
+    descriptor = os.open(directorio, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+# ===============================
+# COLA DE PRIORIDAD CONCURRENTE
+# ===============================
+
+class ColaPrioridadConcurrente:
+    """
+    Envoltorio seguro para varios hilos productores/consumidores de una ColaPrioridad.
+    Mantiene la misma interfaz y añade extracción bloqueante con timeout y variantes async.
+    """
+
+    def __init__(self, cola=None):
+        self._cola = cola if cola is not None else ColaPrioridad()
+        self._condicion = threading.Condition()  # Protege la cola y despierta a los consumidores
+        self._esperas_async = []  # Pares (loop, future) de consumidores asyncio esperando
+
+    @property
+    def cola(self):
+        with self._condicion:
+            return self._cola.cola
+
+    def __len__(self):
+        with self._condicion:
+            return len(self._cola)
+
+    @property
+    def historial(self):
+        return self._cola.historial
+
+    def _avisar(self, cantidad):
+        # Debe llamarse con el candado tomado: despierta hilos y consumidores asyncio
+        self._condicion.notify(cantidad)
+        for loop, aviso in self._esperas_async:
+            loop.call_soon_threadsafe(_resolver_aviso, aviso)
+        self._esperas_async.clear()
+
+    def encolar(self, nombre, prioridad):
+        with self._condicion:
+            self._cola.encolar(nombre, prioridad)
+            self._avisar(1)
+
+    def encolar_lote(self, elementos):
+        elementos = list(elementos)
+        with self._condicion:
+            self._cola.encolar_lote(elementos)
+            self._avisar(len(elementos))
+
+    def desencolar(self, bloquear=False, timeout=None):
+        """Extrae el elemento de mayor prioridad; si bloquear es True espera hasta timeout segundos"""
+        with self._condicion:
+            if bloquear and not self._condicion.wait_for(lambda: len(self._cola), timeout):
+                return None  # Se agotó el tiempo de espera
+            return self._cola.desencolar()
+
+    def desencolar_lote(self, k):
+        with self._condicion:
+            return self._cola.desencolar_lote(k)
+
+    def buscar(self, nombre):
+        with self._condicion:
+            return self._cola.buscar(nombre)
+
+    def editar(self, nombre, nueva_prioridad):
+        with self._condicion:
+            return self._cola.editar(nombre, nueva_prioridad)
+
+    def vaciar(self):
+        with self._condicion:
+            self._cola.vaciar()
+
+    def obtener_estadisticas(self):
+        with self._condicion:
+            return self._cola.obtener_estadisticas()
+
+    async def encolar_async(self, nombre, prioridad):
+        self.encolar(nombre, prioridad)  # El candado solo se retiene unos microsegundos
+
+    async def desencolar_async(self, timeout=None):
+        """Espera sin bloquear el event loop hasta que haya un elemento o venza el timeout"""
+        loop = asyncio.get_running_loop()
+        limite = None if timeout is None else loop.time() + timeout
+        while True:
+            with self._condicion:
+                elemento = self._cola.desencolar()
+                if elemento is not None:
+                    return elemento
+                aviso = loop.create_future()
+                self._esperas_async.append((loop, aviso))
+            try:
+                restante = None if limite is None else limite - loop.time()
+                if restante is not None and restante <= 0:
+                    return None
+                await asyncio.wait_for(aviso, restante)
+            except asyncio.TimeoutError:
+                return None
+            finally:
+                with self._condicion:
+                    if (loop, aviso) in self._esperas_async:
+                        self._esperas_async.remove((loop, aviso))
+
+
+def _resolver_aviso(aviso):
+    # Se ejecuta dentro del event loop del consumidor (puede haber sido cancelado)
+    if not aviso.done():
+        aviso.set_result(None)
+
+# ===============================
+# VISTA ORDENADA PARA LA INTERFAZ
+# ===============================
+
+class VistaOrdenada:
+    """
+    Espejo ordenado de la cola que la interfaz mantiene con bisect en cada operación.
+    Solo se muestran `alto` filas a partir de `inicio`; cada cambio se traduce en
+    operaciones por fila sobre esa ventana: ("insertar", fila, elemento),
+    ("eliminar", fila) o ("limpiar",).
+    """
+
+    def __init__(self, alto):
+        self.alto = alto
+        self.elementos = []  # Todas las tuplas (prioridad, nombre) en orden
+        self.inicio = 0  # Índice del primer elemento visible
+
+    def insertar(self, elemento):
+        i = bisect.bisect_right(self.elementos, elemento)
+        self.elementos.insert(i, elemento)
+        if i < self.inicio:
+            self.inicio += 1  # Entró por encima de la ventana: lo visible no cambia
+            return []
+        if i >= self.inicio + self.alto:
+            return []
+        cambios = [("insertar", i - self.inicio, elemento)]
+        if len(self.elementos) - self.inicio > self.alto:
+            cambios.append(("eliminar", self.alto))  # La última fila sale de la ventana
+        return cambios
+
+    def eliminar(self, elemento):
+        i = bisect.bisect_left(self.elementos, elemento)
+        del self.elementos[i]
+        if i < self.inicio:
+            self.inicio -= 1
+            return []
+        if i >= self.inicio + self.alto:
+            return []
+        cambios = [("eliminar", i - self.inicio)]
+        ultimo = self.inicio + self.alto - 1
+        if ultimo < len(self.elementos):
+            cambios.append(("insertar", self.alto - 1, self.elementos[ultimo]))  # Entra una por abajo
+        elif self.inicio > 0:
+            self.inicio -= 1  # Al final de la lista: se rellena por arriba
+            cambios.append(("insertar", 0, self.elementos[self.inicio]))
+        return cambios
+
+    def vaciar(self):
+        self.elementos.clear()
+        self.inicio = 0
+        return [("limpiar",)]
+
+    def mover_a(self, inicio):
+        """Desplaza la ventana y devuelve las operaciones para redibujar solo las filas visibles"""
+        inicio = max(0, min(inicio, len(self.elementos) - self.alto))
+        if inicio == self.inicio:
+            return []
+        self.inicio = inicio
+        visibles = self.elementos[inicio:inicio + self.alto]
+        return [("limpiar",)] + [("insertar", fila, elemento) for fila, elemento in enumerate(visibles)]
+
+    def fraccion(self):
+        """Fracciones (primera, última) visibles, en el formato que espera una Scrollbar"""
+        total = len(self.elementos)
+        if not total:
+            return (0.0, 1.0)
+        return (self.inicio / total, min(1.0, (self.inicio + self.alto) / total))
 
 # ===============================
 # INTERFAZ GRÁFICA ESTÉTICA
@@ -99,8 +920,17 @@ class InterfazColaPrioridad:
 
         # Lista de elementos
         tk.Label(frame, text="📋 Elementos en la cola:", font=fuente, bg="#fff5e6").grid(row=7, column=0, columnspan=2, pady=(10, 2))
-        self.lista = tk.Listbox(frame, width=45, height=6, font=("Consolas", 10), bg="#fffaf0")
-        self.lista.grid(row=8, column=0, columnspan=2, pady=4)
+        # Solo se crean las filas visibles: la barra desplaza la ventana de la vista ordenada
+        self.vista = VistaOrdenada(alto=6)
+        marco_lista = tk.Frame(frame, bg="#fff5e6")
+        marco_lista.grid(row=8, column=0, columnspan=2, pady=4)
+        self.lista = tk.Listbox(marco_lista, width=45, height=self.vista.alto, font=("Consolas", 10), bg="#fffaf0")
+        self.lista.pack(side="left")
+        self.barra = tk.Scrollbar(marco_lista, orient="vertical", command=self.desplazar)
+        self.barra.pack(side="right", fill="y")
+        self.lista.bind("<MouseWheel>", lambda e: self.desplazar("scroll", -1 if e.delta > 0 else 1, "units"))
+        self.lista.bind("<Button-4>", lambda e: self.desplazar("scroll", -1, "units"))
+        self.lista.bind("<Button-5>", lambda e: self.desplazar("scroll", 1, "units"))
 
         # Estadísticas de la cola
         self.stats_label = tk.Label(frame, text="Estadísticas: Total=0, Mayor=N/A, Promedio=N/A", font=fuente, bg="#fff5e6")
@@ -115,11 +945,17 @@ class InterfazColaPrioridad:
     # FUNCIONES DE LA INTERFAZ
     # ===============================
 
-    def actualizar_lista(self):
-        """Actualiza visualmente la lista de elementos actuales en la cola"""
-        self.lista.delete(0, tk.END)
-        for prioridad, nombre in sorted(self.cola.cola):
-            self.lista.insert(tk.END, f"{nombre} (Prioridad: {prioridad})")
+    def actualizar_lista(self, cambios):
+        """Aplica al Listbox solo los cambios de fila de la ventana visible"""
+        for cambio in cambios:
+            if cambio[0] == "insertar":
+                prioridad, nombre = cambio[2]
+                self.lista.insert(cambio[1], f"{nombre} (Prioridad: {prioridad})")
+            elif cambio[0] == "eliminar":
+                self.lista.delete(cambio[1])
+            else:
+                self.lista.delete(0, tk.END)
+        self.barra.set(*self.vista.fraccion())
 
         total, min_p, prom = self.cola.obtener_estadisticas()
         if total:
@@ -127,12 +963,26 @@ class InterfazColaPrioridad:
         else:
             self.stats_label.config(text="Estadísticas: Total=0, Mayor=N/A, Promedio=N/A")
 
-    def actualizar_historial(self):
-        """Muestra el historial de elementos desencolados"""
+    def desplazar(self, accion, cantidad, unidad=None):
+        """Atiende la barra y la rueda del ratón moviendo la ventana visible"""
+        if accion == "moveto":
+            inicio = int(float(cantidad) * len(self.vista.elementos))
+        else:
+            paso = self.vista.alto if unidad == "pages" else 1
+            inicio = self.vista.inicio + int(cantidad) * paso
+        self.actualizar_lista(self.vista.mover_a(inicio))
+        return "break"
+
+    def actualizar_historial(self, elementos):
+        """Agrega al panel de historial solo los elementos recién desencolados"""
         self.historial.config(state="normal")
-        self.historial.delete("1.0", tk.END)
-        for prioridad, nombre in self.cola.historial:
+        for prioridad, nombre in elementos:
             self.historial.insert(tk.END, f"{nombre} (Prioridad: {prioridad})\n")
+        # El panel conserva como máximo las entradas que el historial guarda en memoria
+        lineas = int(self.historial.index("end-1c").split(".")[0]) - 1
+        exceso = lineas - self.cola.historial.capacidad
+        if exceso > 0:
+            self.historial.delete("1.0", f"{exceso + 1}.0")
         self.historial.config(state="disabled")
 
     def encolar(self):
@@ -145,15 +995,15 @@ class InterfazColaPrioridad:
             return
 
         self.cola.encolar(nombre, int(prioridad))
-        self.actualizar_lista()
+        self.actualizar_lista(self.vista.insertar((int(prioridad), nombre)))
 
     def desencolar(self):
         """Elimina el elemento con mayor prioridad"""
         elemento = self.cola.desencolar()
         if elemento:
             messagebox.showinfo("Elemento desencolado", f"{elemento[1]} fue eliminado.")
-            self.actualizar_lista()
-            self.actualizar_historial()
+            self.actualizar_lista(self.vista.eliminar(elemento))
+            self.actualizar_historial([elemento])
         else:
             messagebox.showinfo("Cola vacía", "No hay elementos para desencolar.")
 
@@ -162,15 +1012,15 @@ class InterfazColaPrioridad:
         nombre = self.nombre_entry.get().strip()
         resultado = self.cola.buscar(nombre)
         if resultado:
-            pos, prioridad = resultado
-            messagebox.showinfo("Encontrado", f"{nombre} está en la posición {pos} con prioridad {prioridad}.")
+            llegada, prioridad = resultado
+            messagebox.showinfo("Encontrado", f"{nombre} está en la cola con prioridad {prioridad} (llegada n.º {llegada}).")
         else:
             messagebox.showinfo("No encontrado", f"No se encontró a {nombre} en la cola.")
 
     def vaciar_cola(self):
         """Elimina todos los elementos de la cola"""
         self.cola.vaciar()
-        self.actualizar_lista()
+        self.actualizar_lista(self.vista.vaciar())
 
     def editar(self):
         """Permite cambiar la prioridad de un elemento existente"""
@@ -181,9 +1031,10 @@ class InterfazColaPrioridad:
 
         nueva = simpledialog.askinteger("Editar Prioridad", f"Nueva prioridad para {nombre}:")
         if nueva is not None:
+            anterior = self.cola.obtener(nombre)
             if self.cola.editar(nombre, nueva):
                 messagebox.showinfo("Actualizado", f"Prioridad de {nombre} modificada.")
-                self.actualizar_lista()
+                self.actualizar_lista(self.vista.eliminar(anterior) + self.vista.insertar((nueva, anterior[1])))
             else:
                 messagebox.showerror("No encontrado", f"{nombre} no está en la cola.")
 
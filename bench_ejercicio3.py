@@ -0,0 +1,223 @@
+# ===============================
+# BENCHMARKS DE LA LISTA DE REPRODUCCIÓN (Ejercicio3.py)
+# ===============================
+# Uso:
+#   python bench_ejercicio3.py carga --tamanos 10000 50000 200000
+#   python bench_ejercicio3.py memoria --n 1000000
+#   python bench_ejercicio3.py archivos --n 1000000
+
+import argparse  # Para leer los parámetros de la línea de comandos
+import os  # Borrar los archivos temporales
+import random  # Posiciones al azar para los saltos
+import tempfile  # Archivos de lista temporales
+import time  # Para medir tiempos con perf_counter
+import tracemalloc  # Memoria reservada por cada representación de nodos
+
+from Ejercicio3 import Cancion, ListaReproduccion
+
+
+class CancionConDict:
+    """Nodo como era antes de __slots__: cada instancia lleva su propio __dict__"""
+    def __init__(self, nombre):
+        self.nombre = nombre
+        self.siguiente = None
+        self.anterior = None
+
+
+def escribir_lista_temporal(n):
+    """Crea un archivo de lista con n canciones y devuelve su ruta"""
+    descriptor, ruta = tempfile.mkstemp(suffix=".txt")
+    with os.fdopen(descriptor, "w") as f:
+        f.writelines(f"Cancion {i}\n" for i in range(n))
+    return ruta
+
+
+# ---------- Carga de listas ----------
+
+def bench_carga(args):
+    print(f"{'canciones':>10} {'segundos':>9} {'µs/canción':>11}")
+    for n in args.tamanos:
+        ruta = escribir_lista_temporal(n)
+        try:
+            lista = ListaReproduccion()
+            inicio = time.perf_counter()
+            lista.cargar_lista(ruta)
+            segundos = time.perf_counter() - inicio
+        finally:
+            os.remove(ruta)
+        print(f"{n:>10} {segundos:>9.3f} {segundos / n * 1e6:>11.2f}")
+
+
+# ---------- Memoria y recorrido de los nodos ----------
+
+def construir_cadena(clase, nombres):
+    primera = anterior = None
+    for nombre in nombres:
+        nodo = clase(nombre)
+        if anterior is None:
+            primera = nodo
+        else:
+            anterior.siguiente = nodo
+            nodo.anterior = anterior
+        anterior = nodo
+    return primera
+
+
+def recorrer(primera):
+    total = 0
+    temp = primera
+    while temp:
+        total += len(temp.nombre)
+        temp = temp.siguiente
+    return total
+
+
+def medir_memoria(funcion):
+    """Devuelve (resultado, bytes reservados que siguen vivos al terminar)"""
+    tracemalloc.start()
+    resultado = funcion()
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, actual
+
+
+def bench_memoria(args):
+    # Nombres repetidos, como en una biblioteca con versiones y recopilaciones
+    nombres = [f"Cancion {i % args.distintas}" for i in range(args.n)]
+    print(f"n={args.n}  nombres distintos={args.distintas}")
+    print(f"{'representación':<28} {'bytes/canción':>14} {'recorrido (s)':>14}")
+    for etiqueta, clase in (("nodos con __dict__", CancionConDict), ("nodos con __slots__", Cancion)):
+        primera, memoria = medir_memoria(lambda: construir_cadena(clase, nombres))
+        inicio = time.perf_counter()
+        recorrer(primera)
+        segundos = time.perf_counter() - inicio
+        print(f"{etiqueta:<28} {memoria / args.n:>14.1f} {segundos:>14.3f}")
+        del primera
+
+    def lista_completa():
+        # Los nombres se crean aquí, como al leer un archivo: los repetidos se internan
+        lista = ListaReproduccion()
+        for i in range(args.n):
+            lista.agregar_cancion(f"Cancion {i % args.distintas}")
+        return lista
+
+    lista, memoria = medir_memoria(lista_completa)
+    print(f"{'ListaReproduccion completa':<28} {memoria / args.n:>14.1f}")
+
+
+# ---------- Guardar y abrir: texto frente a binario ----------
+
+def bench_archivos(args):
+    lista = ListaReproduccion()
+    for i in range(args.n):
+        lista.agregar_cancion(f"Artista {i % 5000} - Canción {i}")
+    directorio = tempfile.mkdtemp(prefix="bench_lista_")
+    texto = os.path.join(directorio, "lista.txt")
+    binario = os.path.join(directorio, "lista.lrb")
+    try:
+        inicio = time.perf_counter()
+        lista.guardar_lista(texto)
+        t_guardar_texto = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        lista.guardar_binario(binario)
+        t_guardar_binario = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        ListaReproduccion().cargar_lista(texto)
+        t_abrir_texto = time.perf_counter() - inicio
+        abierta = ListaReproduccion()
+        inicio = time.perf_counter()
+        abierta.cargar_binario(binario)
+        t_abrir_binario = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        for _ in range(1000):
+            abierta.siguiente_cancion()
+        t_avanzar = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        abierta.obtener_lista()
+        t_resto = time.perf_counter() - inicio
+    finally:
+        for ruta in (texto, binario):
+            if os.path.exists(ruta):
+                os.remove(ruta)
+        os.rmdir(directorio)
+
+    print(f"n={args.n}")
+    print(f"guardar_lista (texto):          {t_guardar_texto:8.3f} s")
+    print(f"guardar_binario:                {t_guardar_binario:8.3f} s")
+    print(f"cargar_lista (texto):           {t_abrir_texto:8.3f} s")
+    print(f"cargar_binario (abrir):         {t_abrir_binario:8.3f} s")
+    print(f"  + avanzar 1000 canciones:     {t_avanzar:8.3f} s")
+    print(f"  + crear el resto de la lista: {t_resto:8.3f} s")
+
+
+# ---------- Acceso por posición ----------
+
+def bench_posicion(args):
+    azar = random.Random(args.semilla)
+    lista = ListaReproduccion()
+    for i in range(args.n):
+        lista.agregar_cancion(f"Cancion {i}")
+    inicio = time.perf_counter()
+    lista.ir_a(0)  # La primera vez se construye el índice de posiciones
+    t_indice = time.perf_counter() - inicio
+
+    indices = [azar.randrange(args.n) for _ in range(args.operaciones)]
+    inicio = time.perf_counter()
+    for k in indices:
+        lista.ir_a(k)
+        lista.posicion_actual()
+    t_saltos = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for k in indices:
+        lista.insertar_cancion(k, "Nueva")
+        lista.eliminar_en(k)
+    t_cambios = time.perf_counter() - inicio
+
+    # Referencia: recorrer los enlaces desde la primera canción hasta la posición
+    muestra = indices[:max(1, args.operaciones // 100)]
+    inicio = time.perf_counter()
+    for k in muestra:
+        temp = lista.primera
+        for _ in range(k):
+            temp = temp.siguiente
+    t_lineal = (time.perf_counter() - inicio) / len(muestra)
+
+    print(f"n={args.n}, operaciones={args.operaciones}")
+    print(f"construir índice de posiciones: {t_indice:8.3f} s")
+    print(f"ir_a + posicion_actual:         {t_saltos / args.operaciones * 1e6:8.2f} µs/op")
+    print(f"insertar_cancion + eliminar_en: {t_cambios / args.operaciones * 1e6:8.2f} µs/op")
+    print(f"recorrido lineal (referencia):  {t_lineal * 1e6:8.2f} µs/op")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de ListaReproduccion")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    carga = subparsers.add_parser("carga", help="tiempo de cargar_lista según el tamaño de la lista")
+    carga.add_argument("--tamanos", type=int, nargs="+", default=[10000, 50000, 200000],
+                       help="cantidades de canciones a cargar")
+    carga.set_defaults(funcion=bench_carga)
+
+    memoria = subparsers.add_parser("memoria", help="memoria y velocidad de recorrido de los nodos")
+    memoria.add_argument("--n", type=int, default=1000000, help="cantidad de canciones")
+    memoria.add_argument("--distintas", type=int, default=100000, help="cantidad de nombres distintos")
+    memoria.set_defaults(funcion=bench_memoria)
+
+    archivos = subparsers.add_parser("archivos", help="guardar/abrir en texto frente al formato binario")
+    archivos.add_argument("--n", type=int, default=1000000, help="cantidad de canciones")
+    archivos.set_defaults(funcion=bench_archivos)
+
+    posicion = subparsers.add_parser("posicion", help="saltos, inserciones y borrados por posición")
+    posicion.add_argument("--n", type=int, default=1000000, help="cantidad de canciones")
+    posicion.add_argument("--operaciones", type=int, default=100000, help="cantidad de operaciones")
+    posicion.add_argument("--semilla", type=int, default=0)
+    posicion.set_defaults(funcion=bench_posicion)
+
+    args = parser.parse_args()
+    args.funcion(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+# ===============================
+# BENCHMARKS DE LA COLA DE PRIORIDAD (Ejercicio4.py)
+# ===============================
+# Uso:
+#   python bench_ejercicio4.py operaciones --salida resultados.json --linea-base base.json
+#   python bench_ejercicio4.py lote --n 100000
+#   python bench_ejercicio4.py concurrencia --n 200000 --hilos 1 2 4 8
+#   python bench_ejercicio4.py recuperacion --n 1000000 --cola-diario 10000
+
+import argparse  # Para leer los parámetros de la línea de comandos
+import asyncio  # Consumidores asyncio para la prueba de concurrencia
+import json  # Resultados legibles por máquina y comparación con una línea base
+import platform  # Versión de Python en los resultados
+import sys  # Salida estándar y código de salida ante regresiones
+import tracemalloc  # Memoria pico al construir la cola
+import threading  # Productores y consumidores en hilos
+import random  # Para generar prioridades aleatorias reproducibles
+import shutil  # Borrar el directorio temporal de la prueba de recuperación
+import tempfile  # Directorio temporal para snapshot y diario
+import time  # Para medir tiempos con perf_counter
+
+from Ejercicio4 import ColaPrioridad, ColaPrioridadConcurrente, ColaPersistente
+
+FIN = (float("inf"), "__fin__")  # Centinela: prioridad infinita, sale después de todo lo demás
+
+
+def generar_elementos(n, semilla=0):
+    """Genera n pares (nombre, prioridad) con nombres únicos"""
+    azar = random.Random(semilla)
+    return [(f"tarea{i}", azar.randint(0, 10 ** 6)) for i in range(n)]
+
+
+def cronometrar(funcion):
+    """Ejecuta la función y devuelve los segundos transcurridos"""
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+
+# ---------- Operaciones básicas por tamaño de cola ----------
+
+OPERACIONES = ("encolar", "desencolar", "buscar", "editar", "obtener_estadisticas", "vaciar")
+
+
+def preparar_cola(elementos):
+    cola = ColaPrioridad()
+    cola.encolar_lote(elementos)
+    return cola
+
+
+def medir_latencias(operacion, elementos, muestras):
+    """Devuelve las latencias en nanosegundos de `muestras` llamadas a la operación"""
+    n = len(elementos)
+    azar = random.Random(1)
+    cola = preparar_cola(elementos)
+    latencias = []
+    reloj = time.perf_counter_ns
+
+    if operacion == "encolar":
+        for i in range(muestras):
+            prioridad = azar.randint(0, 10 ** 6)
+            inicio = reloj()
+            cola.encolar(f"extra{i}", prioridad)
+            latencias.append(reloj() - inicio)
+    elif operacion == "desencolar":
+        for _ in range(min(muestras, n)):
+            inicio = reloj()
+            cola.desencolar()
+            latencias.append(reloj() - inicio)
+    elif operacion == "buscar":
+        for _ in range(muestras):
+            nombre = elementos[azar.randrange(n)][0].upper()  # También ejercita la normalización
+            inicio = reloj()
+            cola.buscar(nombre)
+            latencias.append(reloj() - inicio)
+    elif operacion == "editar":
+        for _ in range(muestras):
+            nombre, prioridad = elementos[azar.randrange(n)][0], azar.randint(0, 10 ** 6)
+            inicio = reloj()
+            cola.editar(nombre, prioridad)
+            latencias.append(reloj() - inicio)
+    elif operacion == "obtener_estadisticas":
+        for _ in range(muestras):
+            inicio = reloj()
+            cola.obtener_estadisticas()
+            latencias.append(reloj() - inicio)
+    elif operacion == "vaciar":
+        # Cada muestra necesita volver a llenar la cola: pocas muestras en tamaños grandes
+        for _ in range(max(3, min(muestras, 10 ** 5 // n))):
+            inicio = reloj()
+            cola.vaciar()
+            latencias.append(reloj() - inicio)
+            cola.encolar_lote(elementos)
+    cola.cerrar()
+    return latencias
+
+
+def percentil(ordenadas, p):
+    return ordenadas[min(len(ordenadas) - 1, int(len(ordenadas) * p))]
+
+
+def memoria_pico(elementos):
+    """Bytes pico reservados por Python al construir una cola con esos elementos"""
+    tracemalloc.start()
+    cola = preparar_cola(elementos)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    cola.cerrar()
+    return pico
+
+
+def comparar_con_base(resultados, base, tolerancia, informe=sys.stdout):
+    """Imprime las diferencias de ops/s frente a la línea base y devuelve las regresiones"""
+    regresiones = []
+    for tamano, datos in resultados["tamanos"].items():
+        datos_base = base["tamanos"].get(tamano)
+        if not datos_base:
+            continue
+        for operacion, medida in datos["operaciones"].items():
+            medida_base = datos_base["operaciones"].get(operacion)
+            if not medida_base:
+                continue
+            cambio = medida["ops_por_segundo"] / medida_base["ops_por_segundo"] - 1
+            marca = ""
+            if cambio < -tolerancia:
+                marca = "  <-- REGRESIÓN"
+                regresiones.append((tamano, operacion, cambio))
+            print(f"{tamano:>8} {operacion:<22} {cambio:+8.1%}{marca}", file=informe)
+    return regresiones
+
+
+def bench_operaciones(args):
+    resultados = {
+        "python": platform.python_version(),
+        "muestras": args.muestras,
+        "tamanos": {},
+    }
+    # Con --salida - el JSON ocupa la salida estándar y la tabla va a la salida de errores
+    informe = sys.stderr if args.salida == "-" else sys.stdout
+    print(f"{'n':>8} {'operación':<22} {'ops/s':>12} {'p50 µs':>9} {'p99 µs':>9}", file=informe)
+    for n in args.tamanos:
+        elementos = generar_elementos(n)
+        datos = {"memoria_pico_bytes": memoria_pico(elementos), "operaciones": {}}
+        for operacion in args.operaciones:
+            latencias = sorted(medir_latencias(operacion, elementos, args.muestras))
+            medida = {
+                "muestras": len(latencias),
+                "ops_por_segundo": len(latencias) / (sum(latencias) / 1e9),
+                "p50_us": percentil(latencias, 0.50) / 1000,
+                "p99_us": percentil(latencias, 0.99) / 1000,
+            }
+            datos["operaciones"][operacion] = medida
+            print(f"{n:>8} {operacion:<22} {medida['ops_por_segundo']:>12.0f} "
+                  f"{medida['p50_us']:>9.2f} {medida['p99_us']:>9.2f}", file=informe)
+        print(f"{n:>8} {'memoria pico':<22} {datos['memoria_pico_bytes'] / 2 ** 20:>10.1f} MiB", file=informe)
+        resultados["tamanos"][str(n)] = datos
+
+    if args.salida == "-":
+        json.dump(resultados, sys.stdout, indent=2)
+        print()
+    elif args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(resultados, f, indent=2)
+
+    if args.linea_base:
+        with open(args.linea_base, encoding="utf-8") as f:
+            base = json.load(f)
+        print(f"\nComparación con {args.linea_base} (tolerancia {args.tolerancia:.0%}):", file=informe)
+        regresiones = comparar_con_base(resultados, base, args.tolerancia, informe)
+        if regresiones:
+            sys.exit(f"{len(regresiones)} regresión(es) de rendimiento")
+
+
+# ---------- Carga y extracción en bloque ----------
+
+def bench_lote(args):
+    elementos = generar_elementos(args.n)
+    k = args.k or args.n
+
+    def encolar_uno_a_uno():
+        for nombre, prioridad in elementos:
+            cola.encolar(nombre, prioridad)
+
+    def desencolar_uno_a_uno():
+        for _ in range(k):
+            cola.desencolar()
+
+    cola = ColaPrioridad()
+    t_encolar = cronometrar(encolar_uno_a_uno)
+    t_desencolar = cronometrar(desencolar_uno_a_uno)
+
+    cola = ColaPrioridad()
+    t_encolar_lote = cronometrar(lambda: cola.encolar_lote(elementos))
+    t_desencolar_lote = cronometrar(lambda: cola.desencolar_lote(k))
+
+    cola = ColaPrioridad()
+    cola.encolar_lote(elementos)
+    t_drenar = cronometrar(lambda: sum(1 for _ in cola.drenar(k)))
+
+    print(f"n={args.n}  k={k}")
+    print(f"encolar x{args.n}:        {t_encolar:8.3f} s")
+    print(f"encolar_lote:            {t_encolar_lote:8.3f} s  ({t_encolar / t_encolar_lote:.1f}x)")
+    print(f"desencolar x{k}:     {t_desencolar:8.3f} s")
+    print(f"desencolar_lote({k}):  {t_desencolar_lote:8.3f} s  ({t_desencolar / t_desencolar_lote:.1f}x)")
+    print(f"drenar({k}):           {t_drenar:8.3f} s  ({t_desencolar / t_drenar:.1f}x)")
+
+
+# ---------- Prueba de estrés concurrente ----------
+
+def producir(cola, elementos):
+    for nombre, prioridad in elementos:
+        cola.encolar(nombre, prioridad)
+
+
+def consumir(cola, contador, indice):
+    recibidos = 0
+    while True:
+        elemento = cola.desencolar(bloquear=True, timeout=5)
+        if elemento is None or elemento == FIN:
+            break
+        recibidos += 1
+    contador[indice] = recibidos
+
+
+async def consumir_async(cola, contador, indice):
+    recibidos = 0
+    while True:
+        elemento = await cola.desencolar_async(timeout=5)
+        if elemento is None or elemento == FIN:
+            break
+        recibidos += 1
+    contador[indice] = recibidos
+
+
+def ejecutar_estres(n, productores, consumidores, usar_asyncio):
+    """Devuelve (segundos, elementos consumidos) para una combinación productores/consumidores"""
+    cola = ColaPrioridadConcurrente()
+    elementos = generar_elementos(n)
+    partes = [elementos[i::productores] for i in range(productores)]
+    contador = [0] * consumidores
+
+    inicio = time.perf_counter()
+    hilos_productores = [threading.Thread(target=producir, args=(cola, parte)) for parte in partes]
+
+    def cerrar_cuando_terminen():
+        for hilo in hilos_productores:
+            hilo.join()
+        for _ in range(consumidores):
+            cola.encolar(FIN[1], FIN[0])
+
+    for hilo in hilos_productores:
+        hilo.start()
+    cierre = threading.Thread(target=cerrar_cuando_terminen)
+    cierre.start()
+
+    if usar_asyncio:
+        async def consumir_todos():
+            await asyncio.gather(*(consumir_async(cola, contador, i) for i in range(consumidores)))
+        asyncio.run(consumir_todos())
+    else:
+        hilos_consumidores = [threading.Thread(target=consumir, args=(cola, contador, i))
+                              for i in range(consumidores)]
+        for hilo in hilos_consumidores:
+            hilo.start()
+        for hilo in hilos_consumidores:
+            hilo.join()
+    cierre.join()
+    return time.perf_counter() - inicio, sum(contador)
+
+
+def bench_concurrencia(args):
+    modo = "consumidores asyncio" if args.asyncio else "consumidores en hilos"
+    print(f"n={args.n}  ({modo})")
+    print(f"{'productores':>11} {'consumidores':>12} {'segundos':>9} {'ops/s':>10}")
+    for hilos in args.hilos:
+        segundos, consumidos = ejecutar_estres(args.n, hilos, hilos, args.asyncio)
+        if consumidos != args.n:
+            raise SystemExit(f"Error: se consumieron {consumidos} de {args.n} elementos")
+        # Cada elemento cuenta una operación de encolar y otra de desencolar
+        print(f"{hilos:>11} {hilos:>12} {segundos:>9.3f} {2 * args.n / segundos:>10.0f}")
+
+
+# ---------- Recuperación tras una caída ----------
+
+def comprobar_repetidos(pruebas, semilla=0):
+    """
+    Con nombres repetidos, editar por nombre elige según el orden del índice y la recuperación
+    no lo reproduce: cerrar y reabrir debe devolver los mismos elementos igual.
+    Devuelve cuántas pruebas recuperaron una cola distinta.
+    """
+    azar = random.Random(semilla)
+    distintas = 0
+    for _ in range(pruebas):
+        directorio = tempfile.mkdtemp(prefix="bench_cola_")
+        try:
+            cola = ColaPersistente(directorio, snapshot_cada=azar.choice([5, 50, 10 ** 12]))
+            for _ in range(azar.randint(5, 40)):
+                cola.encolar(azar.choice("abc"), azar.randint(0, 9))
+            if azar.random() < 0.5:
+                cola.guardar_snapshot()
+            for _ in range(azar.randint(0, 20)):
+                cola.encolar(azar.choice("abc"), azar.randint(0, 9))
+            for _ in range(5):
+                cola.editar(azar.choice("abc"), azar.randint(0, 9))
+                if azar.random() < 0.3:
+                    cola.desencolar()
+            esperado = sorted(cola.cola)
+            cola.cerrar()
+            recuperada = ColaPersistente(directorio)
+            distintas += sorted(recuperada.cola) != esperado
+            recuperada.cerrar()
+        finally:
+            shutil.rmtree(directorio)
+    return distintas
+
+
+def bench_recuperacion(args):
+    directorio = tempfile.mkdtemp(prefix="bench_cola_")
+    try:
+        cola = ColaPersistente(directorio, snapshot_cada=10 ** 12)
+        cola.encolar_lote(generar_elementos(args.n))
+        t_snapshot = cronometrar(cola.guardar_snapshot)
+        # Cola del diario: operaciones posteriores al snapshot
+        azar = random.Random(1)
+        for i in range(args.cola_diario):
+            if i % 4 == 3:
+                cola.desencolar()
+            else:
+                cola.encolar(f"nueva{i}", azar.randint(0, 10 ** 6))
+        cola.sincronizar()
+        esperado = len(cola)
+        cola.cerrar()
+
+        inicio = time.perf_counter()
+        recuperada = ColaPersistente(directorio)
+        t_recuperar = time.perf_counter() - inicio
+        if len(recuperada) != esperado:
+            raise SystemExit(f"Error: se recuperaron {len(recuperada)} de {esperado} elementos")
+        recuperada.cerrar()
+    finally:
+        shutil.rmtree(directorio)
+
+    print(f"n={args.n}  registros en el diario={args.cola_diario}")
+    print(f"guardar_snapshot:   {t_snapshot:8.3f} s")
+    print(f"recuperación:       {t_recuperar:8.3f} s")
+
+    distintas = comprobar_repetidos(args.pruebas_repetidos)
+    print(f"nombres repetidos:  {args.pruebas_repetidos - distintas}/{args.pruebas_repetidos} recuperaciones iguales")
+    if distintas:
+        raise SystemExit(f"Error: {distintas} recuperaciones con nombres repetidos no coinciden")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de ColaPrioridad")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    operaciones = subparsers.add_parser("operaciones", help="ops/s, latencias y memoria por tamaño de cola")
+    operaciones.add_argument("--tamanos", type=int, nargs="+", default=[10 ** e for e in range(2, 7)],
+                             help="tamaños de cola a medir")
+    operaciones.add_argument("--operaciones", nargs="+", choices=OPERACIONES, default=list(OPERACIONES),
+                             help="operaciones a medir")
+    operaciones.add_argument("--muestras", type=int, default=1000, help="llamadas medidas por operación")
+    operaciones.add_argument("--salida", help="archivo JSON de resultados ('-' para la salida estándar)")
+    operaciones.add_argument("--linea-base", help="JSON de una ejecución anterior con el que comparar")
+    operaciones.add_argument("--tolerancia", type=float, default=0.25,
+                             help="caída de ops/s permitida antes de marcar una regresión")
+    operaciones.set_defaults(funcion=bench_operaciones)
+
+    lote = subparsers.add_parser("lote", help="encolar_lote/desencolar_lote frente al bucle elemento a elemento")
+    lote.add_argument("--n", type=int, default=100000, help="número de elementos")
+    lote.add_argument("--k", type=int, default=0, help="elementos a extraer (por defecto todos)")
+    lote.set_defaults(funcion=bench_lote)
+
+    concurrencia = subparsers.add_parser("concurrencia", help="rendimiento con varios productores y consumidores")
+    concurrencia.add_argument("--n", type=int, default=200000, help="elementos producidos en total")
+    concurrencia.add_argument("--hilos", type=int, nargs="+", default=[1, 2, 4, 8],
+                              help="cantidades de productores (y de consumidores) a probar")
+    concurrencia.add_argument("--asyncio", action="store_true", help="consumir con tareas asyncio")
+    concurrencia.set_defaults(funcion=bench_concurrencia)
+
+    recuperacion = subparsers.add_parser("recuperacion", help="tiempo de reconstrucción desde snapshot + diario")
+    recuperacion.add_argument("--n", type=int, default=1000000, help="elementos en el snapshot")
+    recuperacion.add_argument("--cola-diario", type=int, default=10000,
+                              help="operaciones registradas después del snapshot")
+    recuperacion.add_argument("--pruebas-repetidos", type=int, default=300,
+                              help="cierres y reaperturas con nombres repetidos y ediciones a comprobar")
+    recuperacion.set_defaults(funcion=bench_recuperacion)
+
+    args = parser.parse_args()
+    args.funcion(args)
+
+
+if __name__ == "__main__":
+    main()
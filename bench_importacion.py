@@ -0,0 +1,62 @@
+# ===============================
+# TIEMPO DE IMPORTACIÓN DE LOS MÓDULOS SIN INTERFAZ
+# ===============================
+# Uso:
+#   python bench_importacion.py
+#   python bench_importacion.py --presupuesto 30 --repeticiones 10
+#
+# Cada import se mide en un intérprete nuevo (sin módulos en caché). Termina con error si un
+# módulo supera el presupuesto o si al importarlo se carga tkinter.
+
+import argparse  # Para leer los parámetros de la línea de comandos
+import json  # Resultado del proceso hijo
+import os  # Carpeta de los módulos medidos
+import statistics  # Mediana de las repeticiones
+import subprocess  # Un intérprete nuevo por medición
+import sys  # Ejecutable de Python y código de salida
+
+MODULOS = ["procesamiento_texto", "parentesis"]
+
+MEDIR = """
+import json, sys, time
+inicio = time.perf_counter()
+import {modulo}
+transcurrido = time.perf_counter() - inicio
+print(json.dumps({{"ms": transcurrido * 1000, "tkinter": "tkinter" in sys.modules}}))
+"""
+
+
+def medir(modulo):
+    # `python -c` busca los módulos en la carpeta actual: se ejecuta en la del repositorio para
+    # que el banco funcione lanzado desde cualquier lugar
+    salida = subprocess.run([sys.executable, "-c", MEDIR.format(modulo=modulo)],
+                            capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+    return json.loads(salida)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tiempo de importación de los módulos sin interfaz")
+    parser.add_argument("--presupuesto", type=float, default=50.0, help="milisegundos máximos por import")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--modulos", nargs="+", default=MODULOS)
+    args = parser.parse_args()
+
+    fallos = []
+    print(f"{'módulo':<22} {'mediana (ms)':>12} {'tkinter':>8}")
+    for modulo in args.modulos:
+        mediciones = [medir(modulo) for _ in range(args.repeticiones)]
+        mediana = statistics.median(m["ms"] for m in mediciones)
+        con_tkinter = any(m["tkinter"] for m in mediciones)
+        print(f"{modulo:<22} {mediana:>12.2f} {'sí' if con_tkinter else 'no':>8}")
+        if mediana > args.presupuesto:
+            fallos.append(f"{modulo} tarda {mediana:.2f} ms (presupuesto {args.presupuesto:.0f} ms)")
+        if con_tkinter:
+            fallos.append(f"{modulo} importa tkinter")
+
+    if fallos:
+        sys.exit("\n".join(fallos))
+
+
+if __name__ == "__main__":
+    main()
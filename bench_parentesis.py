@@ -0,0 +1,134 @@
+# ===============================
+# BENCHMARKS DEL VERIFICADOR DE PARÉNTESIS (parentesis.py)
+# ===============================
+# Uso:
+#   python bench_parentesis.py escaneo --megas 1 4 16 --densidad 0.03
+#   python bench_parentesis.py paralelo --megas 64 --procesos 1 2 4 8
+
+import argparse  # Para leer los parámetros de la línea de comandos
+import random  # Textos reproducibles
+import time  # Para medir tiempos con perf_counter
+
+from parentesis import verificar_balanceo_detallado
+from parentesis_paralelo import verificar_paralelo
+
+
+def verificar_recorriendo(cadena):
+    """Versión original, carácter por carácter: referencia de resultados y de tiempos"""
+    pila = []
+    pares = {')': '(', '}': '{', ']': '['}
+    resumen = {'(': 0, ')': 0, '{': 0, '}': 0, '[': 0, ']': 0}
+
+    for i, char in enumerate(cadena):
+        if char in '({[':
+            pila.append((char, i))
+            resumen[char] += 1
+        elif char in ')}]':
+            resumen[char] += 1
+            if not pila:
+                return False, f"Error: paréntesis de cierre '{char}' sin apertura en posición {i+1}.", resumen
+            ultimo, pos_ultimo = pila[-1]
+            if ultimo != pares[char]:
+                return False, (
+                    f"Error: paréntesis de cierre '{char}' en posición {i+1} no coincide con "
+                    f"el de apertura '{ultimo}' en posición {pos_ultimo+1}."
+                ), resumen
+            pila.pop()
+
+    if pila:
+        char, pos = pila[-1]
+        return False, f"Error: paréntesis de apertura '{char}' sin cerrar en posición {pos+1}.", resumen
+
+    return True, "✅ Paréntesis balanceados correctamente.", resumen
+
+
+def generar_expresion(caracteres, densidad, azar, profundidad_max=50):
+    """Texto balanceado de unos `caracteres`, con una fracción `densidad` de paréntesis"""
+    partes = []
+    pila = []
+    total = 0
+    while total < caracteres:
+        if azar.random() < densidad:
+            if pila and (len(pila) >= profundidad_max or azar.random() < 0.5):
+                partes.append(pila.pop())
+            else:
+                apertura, cierre = azar.choice(("()", "{}", "[]"))
+                partes.append(apertura)
+                pila.append(cierre)
+        else:
+            partes.append("x" * azar.randint(1, 20))
+        total += len(partes[-1])
+    partes.extend(reversed(pila))
+    return "".join(partes)
+
+
+def con_errores(texto, azar):
+    """El texto balanceado y tres variantes: cierre sin apertura, cierre cruzado y apertura sin cerrar"""
+    medio = len(texto) // 2
+    return {
+        "balanceado": texto,
+        "cierre sin apertura": texto + ")",
+        "no coincide": texto[:medio] + "(]" + texto[medio:],
+        "sin cerrar": texto + "{",
+    }
+
+
+def cronometrar(funcion, texto, repeticiones):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion(texto)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def bench_escaneo(args):
+    azar = random.Random(args.semilla)
+    print(f"{'MB':>4} {'caso':<20} {'recorriendo (s)':>16} {'saltando (s)':>14} {'x':>6}")
+    for megas in args.megas:
+        texto = generar_expresion(int(megas * 2 ** 20), args.densidad, azar)
+        for caso, variante in con_errores(texto, azar).items():
+            t_original, esperado = cronometrar(verificar_recorriendo, variante, args.repeticiones)
+            t_nuevo, obtenido = cronometrar(verificar_balanceo_detallado, variante, args.repeticiones)
+            if obtenido != esperado:
+                raise SystemExit(f"Error: resultados distintos en {megas} MB, caso '{caso}'")
+            print(f"{megas:>4} {caso:<20} {t_original:>16.3f} {t_nuevo:>14.3f} {t_original / t_nuevo:>6.1f}")
+
+
+def bench_paralelo(args):
+    azar = random.Random(args.semilla)
+    texto = generar_expresion(int(args.megas * 2 ** 20), args.densidad, azar)
+    t_base, esperado = cronometrar(verificar_balanceo_detallado, texto, args.repeticiones)
+    print(f"{args.megas} MB, un proceso sin dividir: {t_base:.3f} s")
+    for procesos in args.procesos:
+        t, obtenido = cronometrar(lambda cadena: verificar_paralelo(cadena, procesos), texto, args.repeticiones)
+        if obtenido != esperado:
+            raise SystemExit(f"Error: resultados distintos con {procesos} procesos")
+        print(f"{procesos:>3} procesos: {t:.3f} s  x{t_base / t:.1f}  ({args.megas / t:.0f} MB/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks del verificador de paréntesis")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    escaneo = subparsers.add_parser("escaneo", help="recorrido carácter por carácter frente a saltar entre paréntesis")
+    escaneo.add_argument("--megas", type=float, nargs="+", default=[1, 4, 16], help="tamaños de texto en MB")
+    escaneo.add_argument("--densidad", type=float, default=0.03, help="fracción de fragmentos que son paréntesis")
+    escaneo.add_argument("--repeticiones", type=int, default=3)
+    escaneo.add_argument("--semilla", type=int, default=0)
+    escaneo.set_defaults(funcion=bench_escaneo)
+
+    paralelo = subparsers.add_parser("paralelo", help="trozos resumidos en un pool de procesos")
+    paralelo.add_argument("--megas", type=float, default=64, help="tamaño del texto en MB")
+    paralelo.add_argument("--procesos", type=int, nargs="+", default=[1, 2, 4])
+    paralelo.add_argument("--densidad", type=float, default=0.03)
+    paralelo.add_argument("--repeticiones", type=int, default=1)
+    paralelo.add_argument("--semilla", type=int, default=0)
+    paralelo.set_defaults(funcion=bench_paralelo)
+
+    args = parser.parse_args()
+    args.funcion(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# ===============================
+# BENCHMARK DEL MOTOR DE TRANSFORMACIONES (procesamiento_texto.py)
+# ===============================
+# Compara llamar a las cinco funciones originales por frase con aplicar() (una sola
+# separación en palabras) y con procesar() (además con caché), sobre un tráfico donde
+# unas pocas frases se repiten mucho.
+# Uso:
+#   python bench_texto.py --frases 200000 --distintas 2000
+
+import argparse  # Para leer los parámetros de la línea de comandos
+import random  # Frases y tráfico reproducibles
+import time  # Para medir tiempos con perf_counter
+
+from procesamiento_texto import (
+    invertir_palabras,
+    invertir_letras,
+    invertir_completo,
+    contar_palabras,
+    ordenar_alfabetico,
+    aplicar,
+    procesar,
+)
+
+PALABRAS = ["hola", "Mundo", "árbol", "zeta", "Beta", "casa", "perro", "Gato", "sol", "luna"]
+
+
+def generar_trafico(n, distintas, largo, semilla=0):
+    """n frases elegidas entre `distintas`, con una distribución sesgada como la de uso real"""
+    azar = random.Random(semilla)
+    frases = [" ".join(azar.choice(PALABRAS) for _ in range(azar.randint(1, largo))) for _ in range(distintas)]
+    pesos = [1 / (i + 1) for i in range(distintas)]  # Zipf: la primera frase es la más pedida
+    return azar.choices(frases, weights=pesos, k=n)
+
+
+def originales(frase):
+    return (invertir_palabras(frase), invertir_letras(frase), invertir_completo(frase),
+            contar_palabras(frase), ordenar_alfabetico(frase))
+
+
+def cronometrar(funcion, frases):
+    inicio = time.perf_counter()
+    resultados = [funcion(frase) for frase in frases]
+    return time.perf_counter() - inicio, resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Funciones originales frente al motor de una sola separación")
+    parser.add_argument("--frases", type=int, default=200000)
+    parser.add_argument("--distintas", type=int, default=2000, help="frases distintas en el tráfico")
+    parser.add_argument("--largo", type=int, default=20, help="palabras máximas por frase")
+    args = parser.parse_args()
+
+    frases = generar_trafico(args.frases, args.distintas, args.largo)
+    t_originales, esperado = cronometrar(originales, frases)
+    t_aplicar, obtenido = cronometrar(aplicar, frases)
+    if obtenido != esperado:
+        raise SystemExit("Error: aplicar() no coincide con las funciones originales")
+    procesar.cache_clear()
+    t_procesar, obtenido = cronometrar(procesar, frases)
+    if obtenido != esperado:
+        raise SystemExit("Error: procesar() no coincide con las funciones originales")
+    aciertos = procesar.cache_info().hits
+
+    print(f"frases={args.frases}, distintas={args.distintas}, cinco operaciones por frase")
+    print(f"funciones originales:    {t_originales:8.3f} s")
+    print(f"aplicar (sin caché):     {t_aplicar:8.3f} s  x{t_originales / t_aplicar:.1f}")
+    print(f"procesar (con caché):    {t_procesar:8.3f} s  x{t_originales / t_procesar:.1f}"
+          f"  ({aciertos / args.frases:.0%} aciertos)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# ===============================
+# TRANSFORMACIONES DE TEXTO POR LÍNEA DE COMANDOS
+# ===============================
+# Aplica una de las funciones de procesamiento_texto a cada línea de un archivo (o de la
+# entrada estándar) y escribe los resultados en el mismo orden. La entrada se lee por bloques
+# de líneas que se reparten entre procesos, así que la memoria no depende del tamaño del archivo.
+# Uso:
+#   python cli_texto.py invertir-palabras entrada.txt --salida salida.txt
+#   python cli_texto.py contar-palabras - --procesos 8 < entrada.txt
+
+import argparse  # Para leer los parámetros de la línea de comandos
+import sys  # Entrada y salida estándar
+import time  # Líneas por segundo con --estadisticas
+
+from paralelo import en_bloques, entero_positivo, mapear_ordenado
+from procesamiento_texto import OPERACIONES
+
+# Nombre en la línea de comandos -> operación del motor de procesamiento_texto
+TRANSFORMACIONES = {
+    "invertir-palabras": "invertir_palabras",
+    "invertir-letras": "invertir_letras",
+    "invertir-completo": "invertir_completo",
+    "contar-palabras": "contar_palabras",
+    "ordenar": "ordenar_alfabetico",
+}
+
+
+def procesar_bloque(tarea):
+    """Aplica la transformación a cada línea del bloque y devuelve el texto de salida"""
+    nombre, lineas = tarea
+    operacion = OPERACIONES[TRANSFORMACIONES[nombre]]  # Recibe la línea ya separada en palabras
+    return "".join([operacion(linea.split()) + "\n" for linea in lineas])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aplica una transformación de texto a cada línea")
+    parser.add_argument("transformacion", choices=TRANSFORMACIONES)
+    parser.add_argument("entrada", help="archivo de entrada, o - para la entrada estándar")
+    parser.add_argument("--salida", help="archivo de salida (por defecto la salida estándar)")
+    parser.add_argument("--procesos", type=entero_positivo, default=None, help="procesos de trabajo (por defecto, uno por núcleo)")
+    parser.add_argument("--lineas-por-bloque", type=entero_positivo, default=10000)
+    parser.add_argument("--ventana", type=entero_positivo, default=None, help="bloques en vuelo como máximo")
+    parser.add_argument("--estadisticas", action="store_true", help="informa líneas por segundo en stderr")
+    args = parser.parse_args()
+
+    entrada = sys.stdin if args.entrada == "-" else open(args.entrada, encoding="utf-8")
+    salida = open(args.salida, "w", encoding="utf-8", buffering=1 << 20) if args.salida else sys.stdout
+    lineas = 0
+
+    def tareas():
+        nonlocal lineas
+        for bloque in en_bloques(entrada, args.lineas_por_bloque):
+            lineas += len(bloque)
+            yield args.transformacion, bloque
+
+    inicio = time.perf_counter()
+    try:
+        for texto in mapear_ordenado(procesar_bloque, tareas(), args.procesos, args.ventana):
+            salida.write(texto)
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+    if args.estadisticas:
+        transcurrido = time.perf_counter() - inicio
+        print(f"{lineas} líneas en {transcurrido:.2f} s ({lineas / transcurrido:,.0f} líneas/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# ===============================
+# CONTEO DE PALABRAS EN ARCHIVOS GRANDES
+# ===============================
+# Versión de contar_palabras (procesamiento_texto.py) para archivos de cualquier tamaño: el
+# archivo se mapea en memoria y se cuenta como bytes, por trozos repartidos entre procesos, sin
+# crear una cadena por palabra. Opcionalmente informa la frecuencia de cada palabra.
+# Uso:
+#   python conteo_palabras.py registro.log
+#   python conteo_palabras.py registro.log --procesos 8 --frecuencias 20
+
+import argparse  # Para leer los parámetros de la línea de comandos
+import mmap  # Acceso al archivo sin copiarlo entero a memoria
+import os  # Tamaño del archivo
+import re  # Buscar el próximo espacio para cortar los trozos
+from collections import Counter
+
+from paralelo import entero_positivo, mapear_ordenado
+
+# Separadores de palabras: los espacios ASCII que también separa str.split(). Los espacios Unicode
+# fuera de ASCII (por ejemplo el espacio duro U+00A0) quedan como parte de la palabra.
+ESPACIOS = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+_ESPACIO = re.compile(b"[" + re.escape(ESPACIOS) + b"]")
+# Cada espacio pasa a b" " y todo lo demás a b"x": una palabra empieza en cada b" x"
+_TABLA = bytes(b" "[0] if byte in ESPACIOS else b"x"[0] for byte in range(256))
+# bytes.split() no separa en \x1c-\x1f como str.split(): se convierten antes en b" "
+_SEPARADORES = bytes.maketrans(b"\x1c\x1d\x1e\x1f", b"    ")
+
+TAMANO_TROZO = 64 * 2 ** 20  # Bytes por tarea del pool
+TAMANO_BLOQUE = 8 * 2 ** 20  # Bytes que se copian a la vez dentro de un trozo
+
+
+def _cortar(datos, posicion, fin):
+    """Primera posición >= `posicion` que está en un espacio (o `fin`): ahí no se parte ninguna palabra"""
+    if posicion >= fin:
+        return fin
+    encontrado = _ESPACIO.search(datos, posicion, fin)
+    return encontrado.start() if encontrado else fin
+
+
+def _contar_bloque(bloque):
+    marcas = bloque.translate(_TABLA)
+    # Todos los bloques empiezan en el inicio del archivo o en un espacio
+    return marcas.count(b" x") + (marcas[:1] == b"x")
+
+
+def _contar_trozo(tarea):
+    ruta, inicio, fin, frecuencias = tarea
+    palabras = 0
+    conteo = Counter() if frecuencias else None
+    with open(ruta, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+        while inicio < fin:
+            corte = _cortar(datos, min(inicio + TAMANO_BLOQUE, fin), fin)
+            bloque = datos[inicio:corte]
+            if frecuencias:
+                encontradas = bloque.translate(_SEPARADORES).split()  # Con frecuencias sí hace falta cada palabra
+                palabras += len(encontradas)
+                conteo.update(encontradas)
+            else:
+                palabras += _contar_bloque(bloque)
+            inicio = corte
+    return palabras, conteo
+
+
+def contar_palabras_archivo(ruta, procesos=None, frecuencias=False, tamano_trozo=TAMANO_TROZO):
+    """
+    Cuenta las palabras de un archivo de texto con la misma regla que contar_palabras (separadas
+    por espacios). Devuelve (cantidad, frecuencias); frecuencias es un Counter de palabra -> veces
+    si se pidió, o None.
+    """
+    tamano = os.path.getsize(ruta)
+    if not tamano:
+        return 0, Counter() if frecuencias else None
+    with open(ruta, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+        cortes = [0]
+        while cortes[-1] < tamano:
+            cortes.append(_cortar(datos, cortes[-1] + tamano_trozo, tamano))
+    tareas = [(ruta, inicio, fin, frecuencias) for inicio, fin in zip(cortes, cortes[1:])]
+
+    total = 0
+    conteo = Counter() if frecuencias else None
+    for palabras, parcial in mapear_ordenado(_contar_trozo, tareas, procesos):
+        total += palabras
+        if frecuencias:
+            conteo.update(parcial)
+    if frecuencias:
+        # Secuencias inválidas distintas pueden decodificarse igual (todas a U+FFFD): se suman
+        decodificado = Counter()
+        for palabra, veces in conteo.items():
+            decodificado[palabra.decode("utf-8", "replace")] += veces
+        conteo = decodificado
+    return total, conteo
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cuenta las palabras de un archivo de texto grande")
+    parser.add_argument("archivo")
+    parser.add_argument("--procesos", type=entero_positivo, default=None, help="procesos de trabajo (por defecto, uno por núcleo)")
+    parser.add_argument("--frecuencias", type=int, metavar="N", default=0, help="muestra las N palabras más frecuentes")
+    args = parser.parse_args()
+
+    total, conteo = contar_palabras_archivo(args.archivo, args.procesos, frecuencias=args.frecuencias > 0)
+    print(f"Número de palabras: {total}")
+    if conteo:
+        for palabra, veces in conteo.most_common(args.frecuencias):
+            print(f"{veces:>12}  {palabra}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+# ===============================
+# ORDENAMIENTO ALFABÉTICO EXTERNO
+# ===============================
+# Versión de ordenar_alfabetico (procesamiento_texto.py) para textos que no entran en memoria:
+# las palabras se ordenan por tramos que se vuelcan a archivos temporales y después se mezclan
+# de a k tramos. La memoria depende del límite elegido, no del tamaño de la entrada.
+# Uso:
+#   python ordenamiento_externo.py corpus.txt --salida ordenado.txt --memoria-mb 256
+#   python ordenamiento_externo.py corpus.txt --contar
+
+import argparse  # Para leer los parámetros de la línea de comandos
+import bisect  # Cortar cada bloque en el límite de la mezcla
+import itertools  # Agrupar palabras iguales durante la mezcla
+import os  # Rutas de los tramos temporales
+import sys  # Salida estándar
+import tempfile  # Directorio para los tramos
+from collections import Counter
+from operator import itemgetter
+
+COSTO_POR_PALABRA = 200  # Bytes aproximados por palabra en un tramo (cadena, clave y tupla al ordenar)
+MAX_TRAMOS = 64  # Tramos que se mezclan a la vez; con más se hacen varias pasadas
+BLOQUE = 1 << 16  # Palabras por escritura y caracteres por lectura: el trabajo por palabra queda en C
+
+_clave = itemgetter(0)
+_palabra = itemgetter(1)
+
+
+def _tramos_ordenados(textos, limite_memoria):
+    # Junta palabras hasta el límite y devuelve cada tramo ordenado. Las claves se calculan una
+    # vez por palabra con map(str.lower) y se ordena con itemgetter, sin una lambda por palabra.
+    tramo = []
+    ocupado = 0
+    for texto in textos:
+        palabras = texto.split()
+        tramo.extend(palabras)
+        ocupado += len(texto) + COSTO_POR_PALABRA * len(palabras)
+        if ocupado >= limite_memoria:
+            yield list(map(_palabra, sorted(zip(map(str.lower, tramo), tramo), key=_clave)))
+            tramo = []
+            ocupado = 0
+    if tramo:
+        yield list(map(_palabra, sorted(zip(map(str.lower, tramo), tramo), key=_clave)))
+
+
+def _escribir_palabras(lotes, salida):
+    # Cada lote es una lista de palabras; se escriben de a una por línea con un solo join
+    escritas = 0
+    for lote in lotes:
+        if lote:
+            escritas += len(lote)
+            salida.write("\n".join(lote))
+            salida.write("\n")
+    return escritas
+
+
+def _escribir_tramo(lotes, directorio, nombre):
+    ruta = os.path.join(directorio, f"tramo_{nombre}.txt")
+    with open(ruta, "w", encoding="utf-8", buffering=1 << 20) as f:
+        _escribir_palabras(lotes, f)  # Las palabras salen de split: no tienen saltos de línea
+    return ruta
+
+
+def _leer_tramo(ruta, caracteres):
+    # Devuelve el tramo por bloques de unos `caracteres`, como listas (claves, palabras)
+    with open(ruta, encoding="utf-8") as f:
+        resto = ""
+        while True:
+            bloque = f.read(caracteres)
+            if not bloque:
+                return
+            palabras = (resto + bloque).split("\n")
+            resto = palabras.pop()  # Línea incompleta: se completa con el bloque siguiente
+            if palabras:
+                yield list(map(str.lower, palabras)), palabras
+
+
+def _mezclar(rutas, limite_memoria):
+    """
+    Mezcla k tramos ordenados por bloques en lugar de palabra por palabra: en cada vuelta sale
+    todo lo que es menor que la menor de las últimas claves leídas, ordenado con sorted(), que
+    hace en C lo que heapq.merge haría con una comparación en Python por palabra. Como los trozos
+    se concatenan en el orden de los tramos y sorted() es estable, ante claves iguales sale primero
+    el tramo anterior, igual que con sorted() sobre toda la entrada. Devuelve lotes de palabras.
+    Las claves iguales al límite también salen, del primer tramo que termina en el límite y de los
+    anteriores a él: así cada vuelta vacía ese tramo y la memoria queda en un bloque por tramo
+    aunque una palabra se repita millones de veces.
+    """
+    caracteres = max(4096, limite_memoria // (40 * len(rutas)))
+    lectores = [_leer_tramo(ruta, caracteres) for ruta in rutas]
+    buffers = [next(lector, ([], [])) for lector in lectores]
+    abiertos = [bool(claves) for claves, _ in buffers]
+    while True:
+        pendientes = [buffers[i][0][-1] for i in range(len(rutas)) if abiertos[i]]
+        if not pendientes:
+            claves = list(itertools.chain.from_iterable(c for c, _ in buffers))
+            palabras = list(itertools.chain.from_iterable(p for _, p in buffers))
+            yield list(map(_palabra, sorted(zip(claves, palabras), key=_clave)))
+            return
+        limite = min(pendientes)
+        # Los tramos anteriores a `primero` ya tienen en memoria todas sus claves iguales al límite
+        # (su última clave es mayor o están cerrados); los posteriores esperan a que `primero` se agote
+        primero = next(i for i in range(len(rutas)) if abiertos[i] and buffers[i][0][-1] == limite)
+        claves_lote, palabras_lote = [], []
+        for i, (claves, palabras) in enumerate(buffers):
+            corte = (bisect.bisect_right if i <= primero else bisect.bisect_left)(claves, limite)
+            claves_lote.extend(claves[:corte])
+            palabras_lote.extend(palabras[:corte])
+            del claves[:corte], palabras[:corte]
+        # `primero` quedó vacío: se lee su bloque siguiente
+        siguiente = next(lectores[primero], None)
+        if siguiente is None:
+            abiertos[primero] = False
+        else:
+            buffers[primero] = siguiente
+        yield list(map(_palabra, sorted(zip(claves_lote, palabras_lote), key=_clave)))
+
+
+def ordenar_externo(textos, salida, limite_memoria=64 * 2 ** 20, modo=None, directorio=None, max_tramos=MAX_TRAMOS):
+    """
+    Escribe en `salida` (un archivo de texto abierto) todas las palabras de `textos` (cadenas, por
+    ejemplo las líneas de un archivo abierto) ordenadas alfabéticamente sin distinguir mayúsculas,
+    una por línea y en el mismo orden que ordenar_alfabetico.
+    modo=None escribe todas las palabras, "unicas" cada palabra una vez y "contar" cada palabra
+    con su cantidad de apariciones ("palabra\tcantidad"). Devuelve la cantidad de líneas escritas.
+    """
+    if modo not in (None, "unicas", "contar"):
+        raise ValueError(f"modo desconocido: {modo!r}")
+    with tempfile.TemporaryDirectory(prefix="orden_", dir=directorio) as temporal:
+        tramos = _tramos_ordenados(textos, limite_memoria)
+        primero = next(tramos, [])
+        segundo = next(tramos, None)
+        if segundo is None:
+            lotes = [primero]  # Entró todo en memoria: no hace falta ningún archivo
+        else:
+            rutas = []
+            for tramo in itertools.chain((primero, segundo), tramos):
+                rutas.append(_escribir_tramo([tramo], temporal, f"0_{len(rutas)}"))
+            del primero, segundo, tramo  # Que los tramos ya volcados no sigan ocupando memoria
+            # Con demasiados tramos se mezclan por grupos en nuevos tramos hasta que queden pocos
+            pasada = 0
+            while len(rutas) > max_tramos:
+                pasada += 1
+                grupos = [rutas[i:i + max_tramos] for i in range(0, len(rutas), max_tramos)]
+                rutas = []
+                for grupo in grupos:
+                    rutas.append(_escribir_tramo(_mezclar(grupo, limite_memoria), temporal, f"{pasada}_{len(rutas)}"))
+                    for ruta in grupo:
+                        os.remove(ruta)
+            lotes = _mezclar(rutas, limite_memoria)
+
+        if modo is None:
+            return _escribir_palabras(lotes, salida)
+        # Las apariciones de una palabra pueden quedar intercaladas con otras de igual clave
+        # ("Casa", "casa", "Casa"): se cuentan por grupo de clave, en orden de primera aparición
+        escritas = 0
+        for _, grupo in itertools.groupby(itertools.chain.from_iterable(lotes), key=str.lower):
+            cantidades = Counter(grupo)  # Counter conserva el orden de primera aparición
+            if modo == "contar":
+                salida.writelines(f"{palabra}\t{cantidad}\n" for palabra, cantidad in cantidades.items())
+            else:
+                salida.writelines(palabra + "\n" for palabra in cantidades)
+            escritas += len(cantidades)
+        return escritas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ordena alfabéticamente las palabras de un texto de cualquier tamaño")
+    parser.add_argument("entrada", help="archivo de texto")
+    parser.add_argument("--salida", help="archivo de salida (por defecto la salida estándar)")
+    parser.add_argument("--memoria-mb", type=float, default=64, help="memoria aproximada por tramo")
+    parser.add_argument("--temporal", help="directorio para los tramos (por defecto el del sistema)")
+    grupo = parser.add_mutually_exclusive_group()
+    grupo.add_argument("--unicas", dest="modo", action="store_const", const="unicas", help="cada palabra una sola vez")
+    grupo.add_argument("--contar", dest="modo", action="store_const", const="contar", help="cada palabra con su cantidad")
+    args = parser.parse_args()
+
+    salida = open(args.salida, "w", encoding="utf-8", buffering=1 << 20) if args.salida else sys.stdout
+    try:
+        with open(args.entrada, encoding="utf-8") as entrada:
+            ordenar_externo(entrada, salida, int(args.memoria_mb * 2 ** 20), args.modo, args.temporal)
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Reparto de trabajo entre procesos para las herramientas de línea de comandos.
+
+import argparse
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+def mapear_ordenado(funcion, tareas, procesos=None, ventana=None):
+    """
+    Como map(funcion, tareas), pero repartiendo las tareas en un pool de procesos.
+    Los resultados salen en el mismo orden que las tareas y nunca hay más de `ventana`
+    tareas en vuelo, así que `tareas` puede ser un generador perezoso de cualquier tamaño.
+    Con procesos=1 todo se ejecuta en el proceso actual.
+    """
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1:
+        yield from map(funcion, tareas)
+        return
+    ventana = ventana or 2 * procesos  # Lo justo para que ningún proceso quede esperando
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        en_vuelo = deque()
+        for tarea in tareas:
+            if len(en_vuelo) == ventana:
+                yield en_vuelo.popleft().result()
+            en_vuelo.append(pool.submit(funcion, tarea))
+        while en_vuelo:
+            yield en_vuelo.popleft().result()
+
+
+def entero_positivo(texto):
+    """
+    Tipo de argparse para procesos, ventanas y tamaños de bloque: con 0 o un negativo
+    en_bloques nunca cortaría y la memoria dejaría de estar acotada.
+    """
+    try:
+        valor = int(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"se esperaba un entero, no {texto!r}") from None
+    if valor <= 0:
+        raise argparse.ArgumentTypeError(f"debe ser mayor que cero: {valor}")
+    return valor
+
+
+def en_bloques(iterable, tamano):
+    """Agrupa un iterable en listas de hasta `tamano` elementos, sin leerlo entero"""
+    bloque = []
+    for elemento in iterable:
+        bloque.append(elemento)
+        if len(bloque) == tamano:
+            yield bloque
+            bloque = []
+    if bloque:
+        yield bloque
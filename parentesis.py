@@ -0,0 +1,225 @@
+# Verificación y corrección de paréntesis de Ejercicio2.py, sin dependencias de interfaz gráfica:
+# se pueden importar desde scripts y procesos de fondo sin pantalla.
+
+import re  # Saltar directamente de un paréntesis al siguiente
+from bisect import bisect_right
+
+APERTURAS = '({['
+CIERRES = ')}]'
+PARES = {')': '(', '}': '{', ']': '['}
+PATRON_PARENTESIS = re.compile(r"[(){}\[\]]")
+
+# Mensajes de verificar_balanceo_detallado (las posiciones se reciben desde 0 y se muestran desde 1)
+MENSAJE_BALANCEADO = "✅ Paréntesis balanceados correctamente."
+
+def mensaje_cierre_sin_apertura(char, posicion):
+    return f"Error: paréntesis de cierre '{char}' sin apertura en posición {posicion+1}."
+
+def mensaje_no_coincide(char, posicion, apertura, pos_apertura):
+    return (
+        f"Error: paréntesis de cierre '{char}' en posición {posicion+1} no coincide con "
+        f"el de apertura '{apertura}' en posición {pos_apertura+1}."
+    )
+
+def mensaje_sin_cerrar(char, posicion):
+    return f"Error: paréntesis de apertura '{char}' sin cerrar en posición {posicion+1}."
+
+def contar_parentesis(cadena, fin=None):
+    """Cantidad de cada paréntesis en cadena[:fin], sin copiar la cadena"""
+    fin = len(cadena) if fin is None else fin
+    return {char: cadena.count(char, 0, fin) for char in '(){}[]'}
+
+# Función para verificar paréntesis balanceados y detectar errores
+def verificar_balanceo_detallado(cadena):
+    """
+    Verifica si los paréntesis (), {}, [] están balanceados en la cadena.
+    Si hay un error, indica el tipo de paréntesis y la posición exacta (empezando en 1).
+    Devuelve: (balanceado: bool, mensaje: str, resumen: dict)
+    El resumen cuenta los paréntesis hasta el error (inclusive), o de toda la cadena.
+    """
+    # Solo se visitan los paréntesis: el resto del texto lo salta la expresión regular en C
+    pila = []
+    for encontrado in PATRON_PARENTESIS.finditer(cadena):
+        char = encontrado.group()
+        if char in APERTURAS:
+            pila.append((char, encontrado.start()))
+            continue
+        i = encontrado.start()
+        if not pila:
+            # No hay apertura correspondiente
+            return False, mensaje_cierre_sin_apertura(char, i), contar_parentesis(cadena, i + 1)
+        ultimo, pos_ultimo = pila.pop()
+        if ultimo != PARES[char]:
+            # Paréntesis de cierre no coincide con el de apertura
+            return False, mensaje_no_coincide(char, i, ultimo, pos_ultimo), contar_parentesis(cadena, i + 1)
+
+    resumen = contar_parentesis(cadena)
+    if pila:
+        # Hay paréntesis de apertura sin cerrar
+        char, pos = pila[-1]
+        return False, mensaje_sin_cerrar(char, pos), resumen
+
+    return True, MENSAJE_BALANCEADO, resumen
+
+def mensaje_profundidad(maximo, posicion):
+    return f"Error: más de {maximo} paréntesis abiertos a la vez en posición {posicion+1}."
+
+class VerificadorIncremental:
+    """
+    Verificador de paréntesis que recibe el texto por fragmentos (alimentar) sin tenerlo entero
+    en memoria. Las posiciones son absolutas, contando desde el primer fragmento.
+    A diferencia de verificar_balanceo_detallado no se detiene en el primer error: los cierres
+    sin apertura o que no coinciden se anotan y se ignoran (como en corregir_parentesis), y al
+    cerrar se anotan todas las aperturas sin cerrar, de la más interna a la más externa. Así el
+    primer error y el resumen de resultado() son los mismos que los de verificar_balanceo_detallado.
+    Con max_pila, superar esa cantidad de aperturas pendientes es un error que detiene la verificación.
+    """
+    def __init__(self, max_pila=None):
+        self.max_pila = max_pila
+        self.pila = []
+        self.posicion = 0  # Caracteres recibidos hasta ahora
+        self.resumen = dict.fromkeys('(){}[]', 0)
+        self.resumen_error = None  # Conteo hasta el primer error, como lo informa la versión original
+        self.errores = []  # (posición desde 0, mensaje)
+        self.detenido = False
+        self.cerrado = False
+
+    def _anotar_error(self, posicion, mensaje, fragmento, inicio):
+        # `inicio` es la posición absoluta del comienzo del fragmento
+        if self.resumen_error is None:
+            hasta = posicion - inicio + 1
+            self.resumen_error = {char: cantidad + fragmento.count(char, 0, hasta)
+                                  for char, cantidad in self.resumen.items()}
+        self.errores.append((posicion, mensaje))
+
+    def alimentar(self, fragmento):
+        if self.cerrado:
+            raise ValueError("el verificador ya está cerrado")
+        inicio = self.posicion
+        self.posicion += len(fragmento)
+        if self.detenido:
+            self._contar(fragmento)
+            return
+        pila = self.pila
+        for encontrado in PATRON_PARENTESIS.finditer(fragmento):
+            char = encontrado.group()
+            i = inicio + encontrado.start()
+            if char in APERTURAS:
+                if self.max_pila is not None and len(pila) >= self.max_pila:
+                    self._anotar_error(i, mensaje_profundidad(self.max_pila, i), fragmento, inicio)
+                    self.detenido = True
+                    break
+                pila.append((char, i))
+            elif not pila:
+                self._anotar_error(i, mensaje_cierre_sin_apertura(char, i), fragmento, inicio)
+            elif pila[-1][0] != PARES[char]:
+                ultimo, pos_ultimo = pila[-1]
+                self._anotar_error(i, mensaje_no_coincide(char, i, ultimo, pos_ultimo), fragmento, inicio)
+            else:
+                pila.pop()
+        self._contar(fragmento)
+
+    def _contar(self, fragmento):
+        for char in self.resumen:
+            self.resumen[char] += fragmento.count(char)
+
+    def cerrar(self):
+        """Termina la verificación: anota las aperturas sin cerrar y devuelve resultado()"""
+        if not self.cerrado:
+            self.cerrado = True
+            if not self.detenido:
+                for char, pos in reversed(self.pila):
+                    self.errores.append((pos, mensaje_sin_cerrar(char, pos)))
+                if self.pila and self.resumen_error is None:
+                    self.resumen_error = dict(self.resumen)
+        return self.resultado()
+
+    def resultado(self):
+        """(balanceado, mensaje del primer error, resumen), en el formato de verificar_balanceo_detallado"""
+        if not self.errores:
+            return True, MENSAJE_BALANCEADO, dict(self.resumen)
+        return False, self.errores[0][1], dict(self.resumen_error)
+
+    def punto_control(self):
+        """Estado actual, para volver a él con restaurar() y seguir verificando desde esta posición"""
+        # Los errores solo se agregan al final, así que alcanza con recordar cuántos había
+        return (self.posicion, tuple(self.pila), dict(self.resumen),
+                self.resumen_error and dict(self.resumen_error), len(self.errores), self.detenido)
+
+    def restaurar(self, punto):
+        """Vuelve a un punto_control() de este mismo verificador (también después de cerrar)"""
+        self.posicion, pila, resumen, resumen_error, errores, self.detenido = punto
+        self.pila = list(pila)
+        self.resumen = dict(resumen)
+        self.resumen_error = resumen_error and dict(resumen_error)
+        del self.errores[errores:]
+        self.cerrado = False
+
+class VerificacionEnVivo:
+    """
+    Verificación de un texto que se edita: guarda un punto de control cada `intervalo` caracteres
+    y, ante un cambio, vuelve a verificar solo desde el último punto anterior al cambio.
+    """
+    def __init__(self, intervalo=1 << 16, max_pila=None):
+        self.intervalo = intervalo
+        self.verificador = VerificadorIncremental(max_pila)
+        self.posiciones = [0]
+        self.puntos = [self.verificador.punto_control()]
+
+    def revalidar(self, leer, cambio=0):
+        """
+        `cambio` es la primera posición del texto que cambió desde la última verificación y
+        leer(inicio) devuelve el texto desde `inicio` hasta el final. Devuelve el verificador
+        cerrado (con resultado() y todos sus errores); se lee solo desde el punto de control.
+        """
+        # Un punto en la posición p resume texto[:p]: sigue valiendo si el cambio está en p o después
+        conservar = bisect_right(self.posiciones, cambio)
+        del self.posiciones[conservar:], self.puntos[conservar:]
+        inicio = self.posiciones[-1]
+        verificador = self.verificador
+        verificador.restaurar(self.puntos[-1])
+        texto = leer(inicio)
+        for i in range(0, len(texto), self.intervalo):
+            if i:
+                self.posiciones.append(inicio + i)
+                self.puntos.append(verificador.punto_control())
+            verificador.alimentar(texto[i:i + self.intervalo])
+        verificador.cerrar()
+        return verificador
+
+def verificar_archivo(ruta, max_pila=None, tamano_fragmento=1 << 20):
+    """Verifica un archivo de texto por fragmentos y devuelve el VerificadorIncremental cerrado"""
+    verificador = VerificadorIncremental(max_pila)
+    with open(ruta, encoding="utf-8", newline="") as f:  # Posiciones del archivo tal cual, con \r\n
+        while True:
+            fragmento = f.read(tamano_fragmento)
+            if not fragmento:
+                break
+            verificador.alimentar(fragmento)
+    verificador.cerrar()
+    return verificador
+
+# Sugerencia de corrección automática de paréntesis
+def corregir_parentesis(cadena):
+    pila = []
+    resultado = []
+    pares = {')': '(', '}': '{', ']': '['}
+    apertura = {'(': ')', '{': '}', '[': ']'}
+    # Recorre la cadena y construye el resultado corrigiendo sobre la marcha
+    for char in cadena:
+        if char in '({[':
+            pila.append(char)
+            resultado.append(char)
+        elif char in ')}]':
+            if pila and pila[-1] == pares[char]:
+                pila.pop()
+                resultado.append(char)
+            else:
+                # Si hay un cierre sin apertura, lo ignoramos (lo quitamos)
+                continue
+        else:
+            resultado.append(char)
+    # Al final, agregamos los cierres faltantes
+    while pila:
+        resultado.append(apertura[pila.pop()])
+    return ''.join(resultado)
@@ -0,0 +1,234 @@
+# ===============================
+# VERIFICACIÓN DE PARÉNTESIS EN PARALELO
+# ===============================
+# El balanceo se puede calcular por partes: cada trozo se reduce a "cierres que le faltan a lo
+# anterior" y "aperturas que quedan para lo siguiente", y esos resúmenes se combinan en orden.
+# Los trozos se resumen en un pool de procesos (paralelo.py) y se combinan en este proceso, con
+# el mismo primer error y el mismo resumen que verificar_balanceo_detallado.
+# Uso:
+#   python parentesis_paralelo.py archivo expresion.txt --procesos 8
+#   python parentesis_paralelo.py lote expresiones.jsonl --salida resultados.jsonl
+
+import argparse  # Para leer los parámetros de la línea de comandos
+import json  # Entrada y salida del modo por lotes
+import os  # Tamaño del archivo
+import sys  # Entrada y salida estándar
+
+from paralelo import en_bloques, entero_positivo, mapear_ordenado
+from parentesis import (
+    APERTURAS,
+    PARES,
+    MENSAJE_BALANCEADO,
+    PATRON_PARENTESIS,
+    contar_parentesis,
+    mensaje_cierre_sin_apertura,
+    mensaje_no_coincide,
+    mensaje_sin_cerrar,
+    verificar_balanceo_detallado,
+)
+
+TAMANO_TROZO = 4 * 2 ** 20  # Caracteres (o bytes, en archivos) por tarea del pool
+
+
+def resumir_trozo(trozo):
+    """
+    Reduce un trozo a (cierres, aperturas, error), con posiciones relativas al trozo:
+    cierres son los que no encontraron apertura dentro del trozo (se resuelven con lo anterior),
+    aperturas las que quedaron sin cerrar y error el primer cierre que no coincide con una
+    apertura del propio trozo, como (posición, cierre, apertura, posición de la apertura).
+    """
+    pila = []
+    cierres = []
+    for encontrado in PATRON_PARENTESIS.finditer(trozo):
+        char = encontrado.group()
+        if char in APERTURAS:
+            pila.append((char, encontrado.start()))
+        elif not pila:
+            cierres.append((char, encontrado.start()))
+        elif pila[-1][0] != PARES[char]:
+            # Los cierres posteriores ya no importan: este error es anterior a todos ellos
+            return cierres, pila, (encontrado.start(), char) + pila[-1]
+        else:
+            pila.pop()
+    return cierres, pila, None
+
+
+def combinar(resumenes):
+    """
+    Combina en orden los resúmenes (desplazamiento del trozo, resumen) y devuelve
+    (número de trozo del error o None, posición del error o None, mensaje).
+    Un error de apertura sin cerrar no pertenece a un trozo: su resumen es el de todo el texto.
+    """
+    pila = []
+    for numero, (desplazamiento, (cierres, aperturas, error)) in enumerate(resumenes):
+        for char, i in cierres:
+            i += desplazamiento
+            if not pila:
+                return numero, i, mensaje_cierre_sin_apertura(char, i)
+            ultimo, pos_ultimo = pila.pop()
+            if ultimo != PARES[char]:
+                return numero, i, mensaje_no_coincide(char, i, ultimo, pos_ultimo)
+        if error:
+            i, char, ultimo, pos_ultimo = error
+            return numero, i + desplazamiento, mensaje_no_coincide(char, i + desplazamiento, ultimo, pos_ultimo + desplazamiento)
+        pila.extend((char, pos + desplazamiento) for char, pos in aperturas)
+    if pila:
+        char, pos = pila[-1]
+        return None, pos, mensaje_sin_cerrar(char, pos)
+    return None, None, MENSAJE_BALANCEADO
+
+
+def verificar_paralelo(cadena, procesos=None, tamano_trozo=TAMANO_TROZO):
+    """Igual que verificar_balanceo_detallado, resumiendo trozos de la cadena en paralelo"""
+    inicios = range(0, len(cadena), tamano_trozo)
+    resumenes = mapear_ordenado(resumir_trozo, (cadena[i:i + tamano_trozo] for i in inicios), procesos)
+    numero, posicion, mensaje = combinar(zip(inicios, resumenes))
+    if numero is None:
+        return posicion is None, mensaje, contar_parentesis(cadena)
+    return False, mensaje, contar_parentesis(cadena, posicion + 1)
+
+
+# ---------- Archivos grandes ----------
+
+def _leer(ruta, inicio, fin):
+    with open(ruta, "rb") as f:
+        f.seek(inicio)
+        return f.read(fin - inicio).decode("utf-8")
+
+
+def _resumir_parte(tarea):
+    # Cada proceso lee su parte del archivo: entre procesos solo viajan posiciones y resúmenes
+    ruta, inicio, fin = tarea
+    trozo = _leer(ruta, inicio, fin)
+    return len(trozo), contar_parentesis(trozo), resumir_trozo(trozo)
+
+
+def _cortes_utf8(ruta, tamano, tamano_trozo):
+    """Posiciones en bytes para partir el archivo sin cortar un carácter UTF-8 por la mitad"""
+    cortes = [0]
+    with open(ruta, "rb") as f:
+        while cortes[-1] < tamano:
+            corte = cortes[-1] + tamano_trozo
+            if corte < tamano:
+                f.seek(corte)
+                siguientes = f.read(4)
+                # Los bytes de continuación (10xxxxxx) nunca empiezan un carácter
+                corte += next((k for k, byte in enumerate(siguientes) if byte & 0xC0 != 0x80), len(siguientes))
+            cortes.append(min(corte, tamano))
+    return cortes
+
+
+def verificar_archivo_paralelo(ruta, procesos=None, tamano_trozo=TAMANO_TROZO):
+    """
+    verificar_balanceo_detallado sobre un archivo UTF-8 de cualquier tamaño, por partes en
+    paralelo. Las posiciones son de caracteres del archivo tal cual (un \\r\\n cuenta como dos).
+    """
+    cortes = _cortes_utf8(ruta, os.path.getsize(ruta), tamano_trozo)
+    tareas = [(ruta, inicio, fin) for inicio, fin in zip(cortes, cortes[1:])]
+    totales = []  # Conteo de paréntesis de cada parte, para armar el resumen
+    longitudes = []  # Caracteres de cada parte
+
+    def resumenes():
+        desplazamiento = 0
+        for longitud, conteo, resumen in mapear_ordenado(_resumir_parte, tareas, procesos):
+            totales.append(conteo)
+            longitudes.append(longitud)
+            yield desplazamiento, resumen
+            desplazamiento += longitud
+
+    numero, posicion, mensaje = combinar(resumenes())
+    if numero is None:
+        partes = totales
+    else:
+        # Partes anteriores completas y, de la parte del error, hasta el error inclusive
+        parte = _leer(*tareas[numero])
+        partes = totales[:numero] + [contar_parentesis(parte, posicion - sum(longitudes[:numero]) + 1)]
+    resumen = dict.fromkeys('(){}[]', 0)
+    for conteo in partes:
+        for char, cantidad in conteo.items():
+            resumen[char] += cantidad
+    return posicion is None, mensaje, resumen
+
+
+# ---------- Lotes de expresiones (JSONL) ----------
+
+def _verificar_lineas(tarea):
+    campo, numero, lineas = tarea
+    salida = []
+    for linea in lineas:
+        numero += 1
+        if not linea.strip():
+            continue
+        # Una línea mal formada no corta el lote: su resultado lleva "error" en lugar del balanceo
+        dato = None
+        try:
+            dato = json.loads(linea)
+            expresion = dato if isinstance(dato, str) else dato[campo]
+            if not isinstance(expresion, str):
+                raise TypeError
+        except json.JSONDecodeError as error:
+            registro = {"linea": numero, "error": f"JSON inválido: {error}"}
+        except KeyError:
+            registro = {"linea": numero, "error": f"falta el campo {campo!r}"}
+        except TypeError:
+            registro = {"linea": numero, "error": f"se esperaba una cadena o un objeto con {campo!r} de texto"}
+        else:
+            balanceado, mensaje, resumen = verificar_balanceo_detallado(expresion)
+            registro = {"linea": numero, "balanceado": balanceado, "mensaje": mensaje, "resumen": resumen}
+        if isinstance(dato, dict) and "id" in dato:
+            registro["id"] = dato["id"]
+        salida.append(json.dumps(registro, ensure_ascii=False) + "\n")
+    return "".join(salida)
+
+
+def verificar_lote(entrada, salida, campo="expresion", procesos=None, lineas_por_bloque=1000):
+    """
+    Verifica cada línea de un JSONL (una cadena JSON o un objeto con la expresión en `campo`) y
+    escribe un resultado JSON por línea, en el mismo orden. Si el objeto tiene "id" se copia.
+    Las líneas que no se pueden leer dan {"linea": n, "error": ...} y el lote sigue.
+    """
+    def tareas():
+        numero = 0
+        for bloque in en_bloques(entrada, lineas_por_bloque):
+            yield campo, numero, bloque
+            numero += len(bloque)
+
+    for texto in mapear_ordenado(_verificar_lineas, tareas(), procesos):
+        salida.write(texto)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verificación de paréntesis en paralelo")
+    parser.add_argument("--procesos", type=entero_positivo, default=None, help="procesos de trabajo (por defecto, uno por núcleo)")
+    subparsers = parser.add_subparsers(dest="modo", required=True)
+
+    archivo = subparsers.add_parser("archivo", help="verifica un archivo grande como una sola expresión")
+    archivo.add_argument("ruta")
+    archivo.add_argument("--tamano-trozo", type=entero_positivo, default=TAMANO_TROZO, help="bytes por tarea")
+
+    lote = subparsers.add_parser("lote", help="verifica cada expresión de un archivo JSONL")
+    lote.add_argument("entrada", help="archivo JSONL, o - para la entrada estándar")
+    lote.add_argument("--salida", help="archivo JSONL de resultados (por defecto la salida estándar)")
+    lote.add_argument("--campo", default="expresion", help="campo con la expresión en cada objeto")
+    lote.add_argument("--lineas-por-bloque", type=entero_positivo, default=1000)
+    args = parser.parse_args()
+
+    if args.modo == "archivo":
+        balanceado, mensaje, resumen = verificar_archivo_paralelo(args.ruta, args.procesos, args.tamano_trozo)
+        print(mensaje)
+        print("  ".join(f"{char} : {cantidad}" for char, cantidad in resumen.items()))
+        sys.exit(0 if balanceado else 1)
+
+    entrada = sys.stdin if args.entrada == "-" else open(args.entrada, encoding="utf-8")
+    salida = open(args.salida, "w", encoding="utf-8", buffering=1 << 20) if args.salida else sys.stdout
+    try:
+        verificar_lote(entrada, salida, args.campo, args.procesos, args.lineas_por_bloque)
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Funciones de procesamiento de texto de Ejercicio1.py, sin dependencias de interfaz gráfica:
+# se pueden importar desde scripts y procesos de fondo sin pantalla.
+
+from functools import lru_cache  # Caché de resultados para frases repetidas
+
+# ---------------------- FUNCIONES DE PROCESAMIENTO DE TEXTO ----------------------
+
+def invertir_palabras(frase):
+    """
+    Invierte el orden de las palabras en la frase.
+    Ejemplo: "Hola mundo bonito" -> "bonito mundo Hola"
+    """
+    palabras = frase.strip().split()   # Elimina espacios y separa la frase en palabras
+    pila = list(palabras)              # Crea una copia de la lista de palabras (simula una pila)
+    resultado = []
+    while pila:                        # Mientras la pila tenga elementos
+        resultado.append(pila.pop())   # Saca la última palabra y la agrega al resultado
+    return ' '.join(resultado)         # Une las palabras invertidas en una sola cadena
+
+def invertir_letras(frase):
+    """
+    Invierte las letras de cada palabra, pero mantiene el orden de las palabras.
+    Ejemplo: "Hola mundo" -> "aloH odnum"
+    """
+    return ' '.join([palabra[::-1] for palabra in frase.strip().split()])
+
+def invertir_completo(frase):
+    """
+    Invierte completamente la frase (letras y palabras).
+    Ejemplo: "Hola mundo" -> "odnum aloH"
+    """
+    palabras = invertir_palabras(frase)  # Invierte el orden de las palabras
+    return palabras[::-1]                # Invierte todos los caracteres de la frase resultante
+
+def contar_palabras(frase):
+    """
+    Cuenta el número de palabras en la frase.
+    """
+    return f"Número de palabras: {len(frase.strip().split())}"
+
+def ordenar_alfabetico(frase):
+    """
+    Ordena las palabras de la frase alfabéticamente (ignorando mayúsculas/minúsculas).
+    """
+    palabras = sorted(frase.strip().split(), key=lambda x: x.lower())
+    return ' '.join(palabras)
+
+# ---------------------- MOTOR DE TRANSFORMACIONES ----------------------
+# Separa la frase en palabras una sola vez y aplica sobre esa misma lista todas las
+# operaciones pedidas. Cada operación recibe la lista de palabras y no la modifica.
+
+def _invertir_palabras(palabras):
+    return ' '.join(reversed(palabras))
+
+def _invertir_letras(palabras):
+    # Unir en orden inverso y dar vuelta la cadena entera invierte cada palabra en su lugar,
+    # sin crear una cadena por palabra
+    return ' '.join(reversed(palabras))[::-1]
+
+def _contar_palabras(palabras):
+    return f"Número de palabras: {len(palabras)}"
+
+def _ordenar_alfabetico(palabras):
+    return ' '.join(sorted(palabras, key=str.lower))
+
+OPERACIONES = {
+    "invertir_palabras": _invertir_palabras,
+    "invertir_letras": _invertir_letras,
+    # Invertir el orden de las palabras y después todos los caracteres es justamente
+    # invertir_letras: mismo resultado que la función original
+    "invertir_completo": _invertir_letras,
+    "contar_palabras": _contar_palabras,
+    "ordenar_alfabetico": _ordenar_alfabetico,
+}
+
+def aplicar(frase, operaciones=tuple(OPERACIONES)):
+    """
+    Aplica varias operaciones a la frase separándola en palabras una sola vez.
+    `operaciones` es una tupla de claves de OPERACIONES; devuelve una tupla de resultados en
+    el mismo orden.
+    Ejemplo: aplicar("Hola mundo", ("invertir_palabras", "contar_palabras"))
+             -> ("mundo Hola", "Número de palabras: 2")
+    """
+    palabras = frase.split()  # split() sin argumentos ya descarta los espacios de los extremos
+    return tuple([OPERACIONES[operacion](palabras) for operacion in operaciones])
+
+# Igual que aplicar, pero las frases repetidas se responden desde la caché. Para entradas
+# donde casi todas las frases son distintas conviene aplicar: la caché solo agregaría costo.
+procesar = lru_cache(maxsize=4096)(aplicar)